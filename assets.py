@@ -0,0 +1,121 @@
+import os
+import pygame
+import time
+
+import rotation
+
+
+# Directory holding every image used by the game
+RESOURCE_DIR = "resources"
+
+# Images drawn with a white background made transparent
+COLORKEY = (255, 255, 255)
+
+
+class AssetCache():
+    def __init__(self, directory=RESOURCE_DIR):
+        """Registry of converted surfaces shared by every sprite."""
+        self.directory = directory
+        self.surfaces = {}
+        self.masks = {}
+        self.rotations = {}
+
+        # Seconds spent loading and bytes held, keyed on asset name
+        self.load_times = {}
+        self.sizes = {}
+
+    def load_all(self):
+        """Load and convert every image under the resource directory.
+
+        Collision masks are built at the same time. Needs a display mode
+        to be set first so surfaces can be converted. Assets already
+        loaded are skipped, so calling again is cheap.
+        """
+        for root, _, files in os.walk(self.directory):
+            for file in sorted(files):
+                if file.endswith(".png"):
+                    path = os.path.join(root, file)
+                    self.mask(asset_name(path, self.directory))
+
+    def get(self, name):
+        """Return the shared surface for an asset, loading it if needed.
+
+        Surfaces are shared between sprites so must not be drawn on or have
+        their alpha changed; take a copy first if that is needed.
+        """
+        surf = self.surfaces.get(name)
+        if surf is None:
+            surf = self.load(name)
+        return surf
+
+    def mask(self, name):
+        """Return the shared collision mask for an asset."""
+        mask = self.masks.get(name)
+        if mask is None:
+            mask = self.masks[name] = pygame.mask.from_surface(self.get(name))
+        return mask
+
+    def rotated(self, name, max_angle, step=rotation.ROTATION_STEP):
+        """Return the shared rotation cache for an asset."""
+        key = (name, max_angle, step)
+        cache = self.rotations.get(key)
+        if cache is None:
+            cache = rotation.RotationCache(self.get(name), max_angle, step)
+            self.rotations[key] = cache
+        return cache
+
+    def load(self, name):
+        """Load a single asset from disk and store it in the cache."""
+        start = time.perf_counter()
+        path = os.path.join(self.directory, name + ".png")
+        surf = pygame.image.load(path).convert()
+        surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        self.load_times[name] = time.perf_counter() - start
+        self.sizes[name] = surf.get_pitch() * surf.get_height()
+        self.surfaces[name] = surf
+        return surf
+
+    def report(self):
+        """Return lines describing load time and memory for each asset."""
+        lines = []
+        for name in sorted(self.surfaces):
+            ms = 1e3 * self.load_times[name]
+            kb = self.sizes[name] / 1024
+            lines.append(f"{name}: {ms:.2f} ms, {kb:.1f} kB")
+        total_ms = 1e3 * sum(self.load_times.values())
+        total_kb = sum(self.sizes.values()) / 1024
+        lines.append(f"total: {total_ms:.2f} ms, {total_kb:.1f} kB")
+        return lines
+
+
+def asset_name(path, directory=RESOURCE_DIR):
+    """Convert a file path to its asset name, e.g. 'left_rocket/tile072'."""
+    name = os.path.splitext(os.path.relpath(path, directory))[0]
+    return name.replace(os.sep, "/")
+
+
+# Cache shared by the whole game
+CACHE = AssetCache()
+
+
+def load_all():
+    CACHE.load_all()
+
+
+def get(name):
+    return CACHE.get(name)
+
+
+def mask(name):
+    return CACHE.mask(name)
+
+
+def rotated(name, max_angle, step=rotation.ROTATION_STEP):
+    return CACHE.rotated(name, max_angle, step)
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    load_all()
+    print("\n".join(CACHE.report()))
@@ -0,0 +1,294 @@
+"""Play many headless games at once to check difficulty balance.
+
+Games are shared across a pool of worker processes, each game seeded from
+its index so results do not depend on how many workers ran them. Results
+are gathered into per-game arrays and a per-level table of how many games
+reached each level, how many ended there and how dense the missiles were.
+
+Run from the repository root:
+    python balance.py --games 2000 --policy dodge
+    python balance.py --difficulty-decay 0.85 --csv levels.csv --npz games.npz
+"""
+import argparse
+import importlib
+import multiprocessing
+import os
+import random
+import time
+
+import numpy as np
+from pygame.locals import (
+    K_UP,
+    K_DOWN,
+    K_LEFT,
+    )
+
+import enemy
+import simulation
+
+
+# Games run by default, and steps after which a surviving game stops
+N_GAMES = 1000
+N_STEPS = 3000
+
+# Chunks of games handed to each worker, fewer means less messaging but
+# worse balance when games end at very different times
+CHUNKS_PER_WORKER = 8
+
+# Pixels ahead of the player, and above and below it, watched by the bot
+LOOKAHEAD = 250
+CLEARANCE = 20
+
+# Pixels between the bot and a missile when it raises its shield
+DEFEND_RANGE = 40
+
+# Steps the wandering policy holds each choice of keys
+WANDER_HOLD = 10
+
+# Module constants that tune the difficulty, settable from the command line
+TUNING = {
+    "difficulty_period": (simulation, "DIFFICULTY_PERIOD"),
+    "difficulty_decay": (simulation, "DIFFICULTY_DECAY"),
+    "missile_period": (simulation, "MISSILE_PERIOD"),
+    "special_levels": (enemy, "SPECIAL_LEVELS"),
+    }
+
+
+class Idle():
+    def __init__(self, seed):
+        """Never touches the controls."""
+
+    def __call__(self, sim):
+        return simulation.KeyState(), 0
+
+
+class Wander():
+    def __init__(self, seed):
+        """Holds random keys for a while at a time, like a careless player."""
+        self.rng = random.Random(f"{seed}:policy")
+        self.choices = ((), (K_UP,), (K_DOWN,))
+        self.keys = simulation.KeyState()
+        self.steps = 0
+
+    def __call__(self, sim):
+        if self.steps % WANDER_HOLD == 0:
+            self.keys = simulation.KeyState(self.rng.choice(self.choices))
+        self.steps += 1
+        return self.keys, 0
+
+
+class Dodger():
+    def __init__(self, seed):
+        """Moves away from missiles heading its way, shielding when cornered."""
+
+    def __call__(self, sim):
+        player = sim.player.rect
+        keys, actions = [], 0
+
+        # Drift back to the start after a flash
+        if player.left > simulation.START_LEFT:
+            keys.append(K_LEFT)
+
+        # Missiles the shield killed this step stay in the engine until
+        # the next cull, so are left out
+        left, top, width, height = sim.missiles.rects()
+        threats = (sim.missiles.alive[:sim.missiles.count]
+                   & (left + width > player.left) & (left < player.right + LOOKAHEAD)
+                   & (top < player.bottom + CLEARANCE)
+                   & (top + height > player.top - CLEARANCE))
+        if not threats.any():
+            return simulation.KeyState(keys), actions
+
+        # Move away from the threats, unless already against that edge
+        below = (top + height / 2)[threats].mean() > player.centery
+        if player.top <= 0:
+            below = False
+        elif player.bottom >= sim.screen.get_height():
+            below = True
+        keys.append(K_UP if below else K_DOWN)
+
+        if left[threats].min() - player.right < DEFEND_RANGE:
+            actions |= simulation.DEFEND
+        return simulation.KeyState(keys), actions
+
+
+# Policies by name, each built with a game's seed and called every step
+# with the simulation, returning the keys held and action flags
+POLICIES = {
+    "idle": Idle,
+    "wander": Wander,
+    "dodge": Dodger,
+    }
+
+
+def get_policy(name):
+    """Look up a policy by name, or import one given as module:attribute."""
+    if name in POLICIES:
+        return POLICIES[name]
+    module, _, attribute = name.partition(":")
+    if not attribute:
+        raise ValueError(f"unknown policy {name!r}, expected one of "
+                         f"{', '.join(POLICIES)} or module:attribute")
+    return getattr(importlib.import_module(module), attribute)
+
+
+def n_levels(n_steps, difficulty_period=None):
+    """Levels a game of n_steps can reach."""
+    seconds = n_steps * simulation.STEP
+    period = difficulty_period or simulation.DIFFICULTY_PERIOD
+    return int(seconds * 1e3 // period) + 2
+
+
+def init_worker(tuning):
+    """Apply difficulty tuning and open a dummy display in a worker."""
+    for name, value in tuning.items():
+        module, constant = TUNING[name]
+        setattr(module, constant, value)
+
+    # SDL turns SIGTERM into a quit event, which would leave the pool
+    # waiting forever on a worker it terminates
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+    simulation.init_headless()
+
+
+def play(job):
+    """Play one game, returning its results and per-level counts.
+
+    job is the game index, seed, policy name, step limit and level count.
+    """
+    index, seed, policy_name, n_steps, levels = job
+    policy = get_policy(policy_name)(seed)
+    sim = simulation.Simulation(clouds=False, seed=seed)
+    sim.skip_intro()
+
+    # Steps spent on each level, and missiles in play summed over them
+    steps = np.zeros(levels, np.int32)
+    missiles = np.zeros(levels, np.int64)
+    n = 0
+    while sim.alive and n < n_steps:
+        sim.step(*policy(sim))
+        level = min(sim.level, levels) - 1
+        steps[level] += 1
+        missiles[level] += sim.missiles.count
+        n += 1
+    sim.release_sprites()
+    return index, n, sim.score, sim.level, sim.alive, steps, missiles
+
+
+def run(n_games=N_GAMES, n_steps=N_STEPS, policy="dodge", seed=0,
+        workers=None, tuning=None):
+    """Play n_games with seeds from seed upward, returning result arrays."""
+    tuning = tuning or {}
+    workers = workers or os.cpu_count()
+    levels = n_levels(n_steps, tuning.get("difficulty_period"))
+    get_policy(policy)
+
+    results = {
+        "seed": np.arange(seed, seed + n_games, dtype=np.uint64),
+        "steps": np.zeros(n_games, np.int32),
+        "score": np.zeros(n_games, np.int64),
+        "level": np.zeros(n_games, np.int16),
+        "alive": np.zeros(n_games, bool),
+        "level_steps": np.zeros((n_games, levels), np.int32),
+        "level_missiles": np.zeros((n_games, levels), np.int64),
+        }
+    jobs = [(i, seed + i, policy, n_steps, levels) for i in range(n_games)]
+
+    def store(result):
+        i, *values = result
+        for name, value in zip(list(results)[1:], values):
+            results[name][i] = value
+
+    if workers == 1:
+        init_worker(tuning)
+        for job in jobs:
+            store(play(job))
+    else:
+        chunksize = max(1, n_games // (workers * CHUNKS_PER_WORKER))
+        with multiprocessing.Pool(workers, init_worker, (tuning,)) as pool:
+            for result in pool.imap_unordered(play, jobs, chunksize):
+                store(result)
+            pool.close()
+            pool.join()
+    return results
+
+
+def level_table(results):
+    """Per-level rows of level, games reaching it, games ending on it,
+    the chance of ending there once reached and mean missiles in play.
+
+    Games still alive at the step limit are not counted as ending.
+    """
+    level_steps = results["level_steps"]
+    reached = (level_steps > 0).sum(axis=0)
+    ended = np.bincount(
+        results["level"][~results["alive"]] - 1, minlength=level_steps.shape[1])
+    total_steps = level_steps.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hazard = np.where(reached, ended / reached, 0)
+        density = np.where(
+            total_steps, results["level_missiles"].sum(axis=0) / total_steps, 0)
+    levels = np.arange(1, len(reached) + 1)
+    keep = reached > 0
+    return np.rec.fromarrays(
+        [levels[keep], reached[keep], ended[keep], hazard[keep], density[keep]],
+        names="level,reached,ended,hazard,missiles")
+
+
+def report(results, seconds, workers):
+    survival = results["steps"] * simulation.STEP
+    n_games = len(survival)
+    total_steps = results["steps"].sum()
+    print(f"{n_games} games, {total_steps} steps in {seconds:.2f} s on {workers} "
+          f"workers ({n_games / seconds:.1f} games/s, {total_steps / seconds:.0f} steps/s)")
+    p10, p50, p90 = np.percentile(survival, (10, 50, 90))
+    print(f"survival s   mean {survival.mean():7.1f}  p10 {p10:7.1f}  "
+          f"median {p50:7.1f}  p90 {p90:7.1f}")
+    p10, p50, p90 = np.percentile(results["score"], (10, 50, 90))
+    print(f"score        mean {results['score'].mean():7.1f}  p10 {p10:7.0f}  "
+          f"median {p50:7.0f}  p90 {p90:7.0f}")
+    print(f"survived to the step limit {results['alive'].mean():.1%}")
+    print(f"{'level':>5} {'reached':>8} {'ended':>6} {'hazard':>7} {'missiles':>9}")
+    for row in level_table(results):
+        print(f"{row.level:>5} {row.reached:>8} {row.ended:>6} "
+              f"{row.hazard:>7.1%} {row.missiles:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Balance difficulty with bot games.")
+    parser.add_argument("--games", type=int, default=N_GAMES)
+    parser.add_argument("--steps", type=int, default=N_STEPS,
+                        help="steps after which a surviving game stops")
+    parser.add_argument("--policy", default="dodge",
+                        help=f"one of {', '.join(POLICIES)} or module:attribute")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--csv", help="write the per-level table to this file")
+    parser.add_argument("--npz", help="write per-game arrays to this file")
+    for name, (module, constant) in TUNING.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float,
+                            help=f"default {getattr(module, constant)}")
+    args = parser.parse_args()
+
+    tuning = {
+        name: getattr(args, name) for name in TUNING
+        if getattr(args, name) is not None}
+    try:
+        get_policy(args.policy)
+    except (ValueError, ImportError, AttributeError) as error:
+        parser.error(str(error))
+
+    start = time.perf_counter()
+    results = run(args.games, args.steps, args.policy, args.seed, args.workers, tuning)
+    report(results, time.perf_counter() - start, args.workers)
+
+    if args.csv:
+        table = level_table(results)
+        np.savetxt(args.csv, table, fmt=("%d", "%d", "%d", "%.4f", "%.2f"),
+                   delimiter=",", header=",".join(table.dtype.names), comments="")
+    if args.npz:
+        np.savez_compressed(args.npz, **results, tuning=repr(tuning))
+
+
+if __name__ == "__main__":
+    main()
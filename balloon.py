@@ -1,22 +1,42 @@
 import pygame
 import random
 
+import assets
+import pool
+
 
 CLOUD_SPEED = 4
 BALLOON_RISE_SPEED = 3
 
+# Free balloons kept for reuse
+BALLOON_POOL_CAP = 8
+
             
-class Balloon(pygame.sprite.Sprite):
-    def __init__(self):
+class Balloon(pool.Pooled, pygame.sprite.Sprite):
+    def __init__(self, rng=random):
         super(Balloon, self).__init__()
-        self.surf = pygame.image.load("resources/balloon.png").convert()
-        self.surf.set_colorkey((255, 255, 255), pygame.RLEACCEL)
+        self.surf = assets.get("balloon")
+        self.rect: pygame.Rect = self.surf.get_rect()
+        self.reset(rng)
         
+    def reset(self, rng=random):
+        """Place just past the right of the screen at a random height."""
         screen_width, screen_height = pygame.display.get_surface().get_size()          
-        height = random.randint(screen_height/4, screen_height)
-        self.rect: pygame.Rect = self.surf.get_rect(topleft=(screen_width, height))
+        height = rng.randint(screen_height // 4, screen_height)
+        self.rect.topleft = (screen_width, height)
+    
+    @property
+    def mask(self):
+        return assets.mask("balloon")
     
     def update(self):
         self.rect.move_ip((-CLOUD_SPEED, -BALLOON_RISE_SPEED))
-        if self.rect.bottom < 0:
-            self.kill()   
\ No newline at end of file
+            
+    def kill(self):
+        super(Balloon, self).kill()
+        self.release()
+
+
+# Recycled balloons
+POOL = pool.SpritePool(Balloon, BALLOON_POOL_CAP)
+   
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""Player collision checks against a growing number of enemies.
+
+Compares a linear pygame.sprite.spritecollide scan with the missile
+engine's query, which tests rects one by one below ARRAY_COLLIDE_COUNT
+missiles and in one test over its arrays from there, timing each way.
+
+Run from the repository root: python benchmarks/bench_collision.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import enemy
+
+
+COUNTS = [10, 100, 1000, 10000]
+N_REPEATS = 50
+SCREEN = pygame.Rect(0, 0, 800, 600)
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, rect):
+        super().__init__()
+        self.rect = rect
+
+        # Fields read when added to a missile engine
+        self.speed = self.offset = 0
+        self.kind = enemy.STRAIGHT
+        self.hit_size = rect.size
+
+
+def make_enemies(n_enemies):
+    """Missile sized boxes scattered over the screen."""
+    enemies = pygame.sprite.Group()
+    for _ in range(n_enemies):
+        x = random.randint(0, SCREEN.width)
+        y = random.randint(0, SCREEN.height)
+        enemies.add(Box(pygame.Rect(x, y, 20, 10)))
+    return enemies
+
+
+def time_us(func):
+    """Mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(N_REPEATS):
+        func()
+    return 1e6 * (time.perf_counter() - start) / N_REPEATS
+
+
+def time_colliding(engine, rect, array_count):
+    """Microseconds per engine query, testing arrays from array_count."""
+    default = enemy.ARRAY_COLLIDE_COUNT
+    enemy.ARRAY_COLLIDE_COUNT = array_count
+    try:
+        return time_us(lambda: engine.colliding(rect))
+    finally:
+        enemy.ARRAY_COLLIDE_COUNT = default
+
+
+def main():
+    random.seed(0)
+    player = Box(pygame.Rect(100, 275, 64, 50))
+    print(f"{'enemies':>8}  {'linear us':>10}  {'engine us':>10}  "
+          f"{'rects us':>9}  {'arrays us':>10}")
+    for n_enemies in COUNTS:
+        enemies = make_enemies(n_enemies)
+        linear = time_us(lambda: pygame.sprite.spritecollide(player, enemies, False))
+        engine = enemy.MissileEngine(SCREEN)
+        for sprite in enemies:
+            engine.add(sprite)
+        chosen = time_us(lambda: engine.colliding(player.rect))
+        rects = time_colliding(engine, player.rect, float("inf"))
+        arrays = time_colliding(engine, player.rect, 0)
+        hits = pygame.sprite.spritecollide(player, enemies, False)
+        assert set(hits) == set(engine.colliding(player.rect))
+        print(f"{n_enemies:>8}  {linear:>10.1f}  {chosen:>10.1f}  "
+              f"{rects:>9.1f}  {arrays:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Time to move every missile one frame with the missile engine.
+
+Run from the repository root: python benchmarks/bench_missiles.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import assets
+import enemy
+
+
+COUNTS = [10, 100, 1000, 5000, 10000]
+N_FRAMES = 100
+
+# Frame budget at 30 FPS in ms
+BUDGET = 1e3 / 30
+
+
+def time_step(screen, n_missiles):
+    """Mean milliseconds for one engine step with n_missiles alive."""
+    engine = enemy.MissileEngine(screen.get_rect())
+    for _ in range(n_missiles):
+        engine.add(enemy.add_enemy(10, screen))
+    start = time.perf_counter()
+    for _ in range(N_FRAMES):
+        # Keep missiles on screen so none are culled
+        engine.x[:engine.count] %= screen.get_width()
+        engine.step(time.time())
+    return 1e3 * (time.perf_counter() - start) / N_FRAMES
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    assets.load_all()
+    print(f"{'missiles':>8}  {'ms/frame':>8}  {'% budget':>8}")
+    for n_missiles in COUNTS:
+        ms = time_step(screen, n_missiles)
+        print(f"{n_missiles:>8}  {ms:>8.3f}  {100 * ms / BUDGET:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Frame time drawing sine missiles with and without the rotation cache.
+
+Run from the repository root: python benchmarks/bench_rotation.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import assets
+import enemy
+
+
+N_MISSILES = 50
+N_FRAMES = 300
+
+
+def draw_uncached(missile, screen):
+    """Draw a sine missile the way it was drawn before the cache."""
+    rotated_surf = pygame.transform.rotate(missile.surf, missile.angle)
+    screen.blit(rotated_surf, missile.rect)
+
+
+def time_frames(screen, draw):
+    """Mean milliseconds to update and draw every missile for one frame."""
+    engine = enemy.MissileEngine(screen.get_rect())
+    missiles = [enemy.SineMissile(screen) for _ in range(N_MISSILES)]
+    for missile in missiles:
+        engine.add(missile)
+    start = time.perf_counter()
+    for _ in range(N_FRAMES):
+        screen.fill((135, 200, 245))
+        # Keep missiles on screen for the whole run
+        engine.x[:engine.count] %= screen.get_width()
+        engine.step(time.time())
+        for missile in missiles:
+            draw(missile, screen)
+    return 1e3 * (time.perf_counter() - start) / N_FRAMES
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    assets.load_all()
+
+    before = time_frames(screen, draw_uncached)
+    after = time_frames(screen, enemy.SineMissile.draw)
+    print(f"{N_MISSILES} sine missiles, {N_FRAMES} frames")
+    print(f"transform.rotate per frame: {before:.3f} ms/frame")
+    print(f"rotation cache:             {after:.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
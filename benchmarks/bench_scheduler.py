@@ -0,0 +1,52 @@
+"""Cost of running the spawn scheduler with many events pending.
+
+Each row schedules repeating events with random periods, plus a burst
+per event, then times stepping the clock at the simulation rate.
+
+Run from the repository root: python benchmarks/bench_scheduler.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scheduler
+import simulation
+
+
+COUNTS = [4, 100, 1000, 10000]
+N_STEPS = 300
+
+# Range of periods in ms, and missiles in each burst
+PERIODS = (50, 2000)
+BURST = 5
+
+
+def time_steps(n_events):
+    """Mean microseconds per step and per callback with n_events repeating."""
+    rng = random.Random(0)
+    clock = simulation.SimClock()
+    schedule = scheduler.Scheduler(clock)
+    for _ in range(n_events):
+        schedule.every(rng.uniform(*PERIODS), lambda: None)
+        schedule.burst(BURST, rng.uniform(*PERIODS), lambda: None,
+                       delay=rng.uniform(0, 1e3 * N_STEPS * simulation.STEP))
+    start = time.perf_counter()
+    for _ in range(N_STEPS):
+        clock.advance(simulation.STEP)
+        schedule.run_due()
+    seconds = time.perf_counter() - start
+    return 1e6 * seconds / N_STEPS, 1e6 * seconds / max(schedule.calls, 1)
+
+
+def main():
+    print(f"{'events':>8}  {'us/step':>9}  {'us/call':>8}")
+    for n_events in COUNTS:
+        per_step, per_call = time_steps(n_events)
+        print(f"{n_events:>8}  {per_step:>9.1f}  {per_call:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
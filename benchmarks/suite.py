@@ -0,0 +1,238 @@
+"""Scripted stress scenarios run headlessly and compared to a baseline.
+
+Each scenario runs in its own process so peak RSS is measured per
+scenario, several times over, and each metric is the median of the runs.
+Frame times cover a whole GameLoop frame: simulation step, HUD and
+drawing on the dummy video driver. Only the mean and median frame times
+are compared with the baseline, as the tail percentiles of one run hang
+on a few frames and are shown without failing the suite.
+
+Run from the repository root:
+    python benchmarks/suite.py                    compare with baseline.json
+    python benchmarks/suite.py --update-baseline  store new baseline
+    python benchmarks/suite.py missile_storm      run chosen scenarios
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import simulation
+
+
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+SEED = 12345
+N_FRAMES = 600
+
+# Runs of each scenario, whose median metrics are reported
+REPEATS = 5
+
+# Allowed slowdown before a metric counts as a regression
+TOLERANCE = 0.25
+
+# Metrics compared against the baseline, all lower is better
+COMPARED = ("mean_ms", "median_ms")
+
+IDLE = simulation.KeyState()
+
+
+def bench_loop(**options):
+    """GameLoop that skips the real time intro and cannot lose."""
+    import main
+
+    class BenchLoop(main.GameLoop):
+        def player_loses(self, missile):
+            missile.kill()
+
+    loop = BenchLoop(seed=SEED, **options)
+    loop.skip_intro()
+    return loop
+
+
+def set_level(loop, level):
+    """Jump to a level as if the difficulty timer had fired."""
+    while loop.level < level:
+        loop.increase_difficulty()
+
+
+# Scenarios set up a loop and may return a function called every frame
+# with the loop and frame number, which returns the keys held down.
+# GameLoop options for a scenario are kept in OPTIONS.
+
+
+def level_1(loop):
+    pass
+
+
+def missile_storm(loop):
+    set_level(loop, 10)
+
+
+def clouds_500(loop):
+    def top_up(loop, frame):
+        while len(loop.back_clouds) + len(loop.front_clouds) < 500:
+            loop.add_cloud(x=loop.rngs["clouds"].randint(0, 800))
+        return IDLE
+    return top_up
+
+
+def rotating(loop):
+    # Every missile spawned from level 20 weaves, and the plane banks
+    from pygame.locals import K_UP, K_DOWN
+    set_level(loop, 20)
+    up, down = simulation.KeyState([K_UP]), simulation.KeyState([K_DOWN])
+
+    def bank(loop, frame):
+        return up if frame % 40 < 20 else down
+    return bank
+
+
+def waves(loop):
+    # A missile wave launched every two seconds on top of level 5 spawns
+    set_level(loop, 5)
+
+    def launch(loop, frame):
+        if frame % 60 == 0:
+            loop.launch_wave()
+        return IDLE
+    return launch
+
+
+def strobe(loop):
+    set_level(loop, 6)
+
+
+def strobe_blend(loop):
+    set_level(loop, 6)
+
+
+SCENARIOS = {
+    "level_1": level_1,
+    "missile_storm": missile_storm,
+    "clouds_500": clouds_500,
+    "rotating": rotating,
+    "waves": waves,
+    "strobe": strobe,
+    "strobe_blend": strobe_blend,
+    }
+
+OPTIONS = {
+    "strobe_blend": dict(blend_strobe=True),
+    }
+
+
+def run_scenario(name):
+    """Run one scenario in this process and return its metrics."""
+    import numpy as np
+
+    loop = bench_loop(**OPTIONS.get(name, {}))
+    per_frame = SCENARIOS[name](loop)
+    times = np.zeros(N_FRAMES)
+    start = time.perf_counter()
+    for frame in range(N_FRAMES):
+        frame_start = time.perf_counter()
+        keys = per_frame(loop, frame) if per_frame else IDLE
+        loop.step(keys)
+        loop.hud.update(loop.score, loop.level)
+        loop.draw_screen()
+        times[frame] = time.perf_counter() - frame_start
+    seconds = time.perf_counter() - start
+    times *= 1e3
+    return {
+        "mean_ms": float(times.mean()),
+        "median_ms": float(np.median(times)),
+        "p95_ms": float(np.percentile(times, 95)),
+        "p99_ms": float(np.percentile(times, 99)),
+        "frames_per_s": N_FRAMES / seconds,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "enemies": len(loop.enemies),
+        }
+
+
+def run_isolated(name):
+    """Run a scenario in a fresh process so peak RSS is its own."""
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", name],
+        check=True, capture_output=True, text=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def run_repeated(name, repeats):
+    """Median of each metric over repeats isolated runs of a scenario."""
+    runs = [run_isolated(name) for _ in range(repeats)]
+    return {metric: statistics.median(run[metric] for run in runs) for metric in runs[0]}
+
+
+def compare(results, baseline, tolerance):
+    """Return lines describing metrics slower than the baseline allows."""
+    failures = []
+    for name, metrics in results.items():
+        if name not in baseline:
+            continue
+        for metric in COMPARED:
+            limit = baseline[name][metric] * (1 + tolerance)
+            if metrics[metric] > limit:
+                failures.append(
+                    f"{name} {metric}: {metrics[metric]:.3f} > "
+                    f"{limit:.3f} (baseline {baseline[name][metric]:.3f})")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", metavar="scenario")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--repeats", type=int, default=REPEATS,
+                        help="runs of each scenario to take medians over")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child)))
+        return
+
+    names = args.scenarios or list(SCENARIOS)
+    for name in names:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name}, choose from {', '.join(SCENARIOS)}")
+    results = {}
+    print(f"{'scenario':<14} {'mean ms':>8} {'median':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'frames/s':>9} {'RSS MB':>7}")
+    for name in names:
+        m = results[name] = run_repeated(name, args.repeats)
+        print(f"{name:<14} {m['mean_ms']:>8.3f} {m['median_ms']:>8.3f} {m['p95_ms']:>8.3f} "
+              f"{m['p99_ms']:>8.3f} {m['frames_per_s']:>9.0f} {m['peak_rss_mb']:>7.1f}")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(BASELINE):
+            with open(BASELINE) as file:
+                baseline = json.load(file)
+        baseline.update(results)
+        with open(BASELINE, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f"baseline written to {BASELINE}")
+        return
+
+    if not os.path.exists(BASELINE):
+        sys.exit(f"no baseline at {BASELINE}, run with --update-baseline")
+    with open(BASELINE) as file:
+        failures = compare(results, json.load(file), args.tolerance)
+    if failures:
+        print("\nPERFORMANCE REGRESSION")
+        print("\n".join(failures))
+        sys.exit(1)
+    print("\nall scenarios within baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import os
+import queue
+import shlex
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+import pygame
+
+
+# Frames held for the encoder before new frames are dropped
+RING_SIZE = 32
+
+# Ways of writing frames: numbered PNG files in a directory, one file of
+# raw RGB frames, or raw RGB frames piped to an encoder command
+FORMATS = ("png", "raw", "pipe")
+
+# Encoder command fed raw frames on stdin, formatted with the frame size,
+# frame rate and output path
+ENCODER = ("ffmpeg -loglevel error -y -f rawvideo -pix_fmt rgb24 "
+           "-s {width}x{height} -r {fps} -i - -pix_fmt yuv420p {path}")
+
+
+class FrameCapture():
+    def __init__(self, surface: pygame.Surface, path, format="png", fps=60,
+                 ring_size=RING_SIZE, command=ENCODER):
+        """Records frames of a 32 bit surface without holding up the game.
+
+        grab copies whole pixels straight from a surfarray view into a free
+        slot of a preallocated ring, then hands the slot to an encoder
+        thread, which converts it to RGB, writes it and frees the slot.
+        When the encoder falls behind and no slot is free the frame is
+        dropped, so grabbing never waits. Raw frames are RGB bytes, rows
+        top to bottom.
+        """
+        if format not in FORMATS:
+            raise ValueError(f"unknown capture format {format!r}")
+        self.width, self.height = surface.get_size()
+        self.path = path
+        self.format = format
+        self.fps = fps
+        self.command = command
+
+        # Slots hold rows of pixels as stored in the surface, and the byte
+        # of each pixel holding red, green and blue
+        self.ring = np.zeros((ring_size, self.height, self.width), np.uint32)
+        self.channels = [
+            shift // 8 if sys.byteorder == "little" else 3 - shift // 8
+            for shift in surface.get_shifts()[:3]]
+        self.rgb = np.zeros((self.height, self.width, 3), np.uint8)
+        self.free = queue.SimpleQueue()
+        for slot in range(ring_size):
+            self.free.put(slot)
+        self.filled = queue.SimpleQueue()
+
+        # Frames grabbed, dropped and written, seconds spent grabbing and
+        # writing, and the longest grab
+        self.grabbed = 0
+        self.dropped = 0
+        self.written = 0
+        self.grab_time = 0.0
+        self.write_time = 0.0
+        self.max_grab_time = 0.0
+
+        # Error that stopped writing, after which every frame is dropped
+        self.error: OSError = None
+
+        self.output = self.open()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def open(self):
+        """Create the output, returning a file or encoder process if any."""
+        if self.format == "png":
+            os.makedirs(self.path, exist_ok=True)
+            return None
+        if self.format == "raw":
+            return open(self.path, "wb")
+        command = self.command.format(
+            width=self.width, height=self.height, fps=self.fps, path=self.path)
+        return subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE)
+
+    def grab(self, surface: pygame.Surface):
+        """Copy surface into the ring, returning False if dropped."""
+        start = time.perf_counter()
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            kept = False
+        else:
+            # The view locks the surface, so is released at once
+            view = pygame.surfarray.pixels2d(surface)
+            np.copyto(self.ring[slot], view.swapaxes(0, 1))
+            del view
+            self.filled.put(slot)
+            self.grabbed += 1
+            kept = True
+        seconds = time.perf_counter() - start
+        self.grab_time += seconds
+        self.max_grab_time = max(self.max_grab_time, seconds)
+        return kept
+
+    def run(self):
+        while True:
+            slot = self.filled.get()
+            if slot is None:
+                return
+            if self.error:
+                continue
+            start = time.perf_counter()
+            try:
+                self.write(self.ring[slot])
+            except OSError as error:
+                # Keep the slot, so the ring fills and later frames drop
+                self.error = error
+                print(f"capture stopped: {error}", file=sys.stderr)
+                continue
+            self.write_time += time.perf_counter() - start
+            self.written += 1
+            self.free.put(slot)
+
+    def write(self, frame):
+        pixels = frame.view(np.uint8).reshape(self.height, self.width, 4)
+        np.take(pixels, self.channels, axis=2, out=self.rgb)
+        if self.format == "png":
+            path = os.path.join(self.path, f"frame_{self.written:06d}.png")
+            surf = pygame.image.frombuffer(self.rgb, (self.width, self.height), "RGB")
+            pygame.image.save(surf, path)
+        elif self.format == "raw":
+            self.output.write(self.rgb.data)
+        else:
+            self.output.stdin.write(self.rgb.data)
+
+    def close(self):
+        """Write every frame grabbed so far and close the output."""
+        if self.thread is None:
+            return
+        self.filled.put(None)
+        self.thread.join()
+        self.thread = None
+        if self.format == "raw":
+            self.output.close()
+        elif self.format == "pipe":
+            try:
+                self.output.stdin.close()
+            except BrokenPipeError:
+                pass
+            self.output.wait()
+
+    def report(self):
+        """Describe frames captured and the time it took."""
+        frames = self.grabbed + self.dropped
+        grab_ms = 1e3 * self.grab_time / max(frames, 1)
+        write_ms = 1e3 * self.write_time / max(self.written, 1)
+        return (f"wrote {self.written} of {frames} frames to {self.path}, "
+                f"{self.dropped} dropped, grab {grab_ms:.2f} ms mean "
+                f"{1e3 * self.max_grab_time:.2f} ms max, write {write_ms:.2f} ms mean")
@@ -1,9 +1,13 @@
 import numpy as np
 import pygame
 import random
+import threading
 
 
 CLOUD_SPEED = 4
+
+# Back clouds move at half speed for parallax
+BACK_SPEED = CLOUD_SPEED // 2
 MIN_R, MAX_R = 50, 100
 WIDTH, HEIGHT = 500, 400
 RADII = [50, 50, 60, 60, 70, 70, 90]    
@@ -16,26 +20,57 @@ COORDS = [
     (210, 130),
     (290, 130)]
 
-            
-class Cloud(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        size = np.array([350, 200]) * random.randint(2, 10) / 10
-        self.surf = generate_cloud()
-        self.surf = pygame.transform.scale(self.surf, size)
-        self.rect: pygame.Rect = self.surf.get_rect()
+# Cloud size is the base size times a random number of tenths
+BASE_SIZE = (350, 200)
+SCALES = range(2, 11)
+MAX_WIDTH = BASE_SIZE[0] * SCALES[-1] // 10
+
+# Textures generated for each scale, and transparency of the front layer
+VARIANTS = 4
+FRONT_ALPHA = 140
+
+
+class CloudPool():
+    def __init__(self, variants=VARIANTS):
+        """Shared cloud textures, generated once for every scale."""
+        self.variants = variants
         
-        screen_width, screen_height = pygame.display.get_surface().get_size()        
-        x = screen_width
-        y = random.randint(0, screen_height)    
-        self.rect: pygame.Rect = self.surf.get_rect(topleft=(x, y))
+        # Lists of surfaces keyed on scale
+        self.textures = {}
+        self.lock = threading.Lock()
+        self.thread = None
         
-        self.speed = CLOUD_SPEED
-
-    def update(self):
-        self.rect.move_ip(-self.speed, 0)
-        if self.rect.right < 0:
-            self.kill()
+    def start(self, threaded=False):
+        """Generate textures for all scales, optionally in the background."""
+        if self.thread is not None:
+            return
+        if threaded:
+            self.thread = threading.Thread(target=self.generate, daemon=True)
+            self.thread.start()
+        else:
+            self.generate()
+        
+    def generate(self):
+        for scale in SCALES:
+            self.generate_scale(scale)
+        
+    def generate_scale(self, scale):
+        """Generate opaque variants, made transparent by their layer."""
+        with self.lock:
+            if scale in self.textures:
+                return
+            size = np.array(BASE_SIZE) * scale / 10
+            self.textures[scale] = [
+                pygame.transform.scale(generate_cloud(), size)
+                for _ in range(self.variants)]
+            
+    def get(self, scale, rng=random):
+        """Return a random shared texture, generating its scale if needed."""
+        textures = self.textures.get(scale)
+        if textures is None:
+            self.generate_scale(scale)
+            textures = self.textures[scale]
+        return rng.choice(textures)
 
            
 def generate_cloud():
@@ -47,3 +82,7 @@ def generate_cloud():
         w, h = coord
         pygame.draw.circle(surf, (255, 255, 255), (w, h), r)        
     return surf
+
+
+# Textures shared by every cloud
+POOL = CloudPool()
@@ -0,0 +1,28 @@
+import pygame
+import time
+
+
+class NarrowPhase():
+    def __init__(self):
+        """Pixel perfect checks for pairs that passed the rect broad phase.
+
+        Sprites provide a mask matching the surface drawn at their rect.
+        Call count and total time build up until begin_frame, which the
+        game loop calls at the start of every frame. Headless runs never
+        call it, so there they cover the whole game.
+        """
+        self.calls = 0
+        self.time = 0.0
+
+    def begin_frame(self):
+        self.calls = 0
+        self.time = 0.0
+
+    def overlap(self, a: pygame.sprite.Sprite, b: pygame.sprite.Sprite):
+        """True if any opaque pixels of the two sprites overlap."""
+        start = time.perf_counter()
+        offset = (b.rect.x - a.rect.x, b.rect.y - a.rect.y)
+        hit = a.mask.overlap(b.mask, offset) is not None
+        self.calls += 1
+        self.time += time.perf_counter() - start
+        return hit
@@ -1,47 +1,78 @@
 import pygame
-import time
-
-
-class FlashCoolDown():
-    def __init__(self):
-        self.surface = pygame.Surface((100, 20))
-        self.surface.fill((100, 255, 100))
-        self.rect = self.surface.get_rect()    
-        self.prev_flash = 0
-        self.length = self.max_length = 100
-        self.cool_down = 5
-    
-    def update(self):
-        delay = (time.time()-self.prev_flash)
-        self.length = self.max_length * (1 - delay / self.cool_down)
-        if self.length < 0:
-            self.length = 0
-        self.rect.width = self.length
-        self.surface.fill((100, 255, 100))
-        pygame.draw.rect(self.surface, (255, 0, 0), self.rect)       
-        
-    def flash(self):
-        self.prev_flash = time.time()
-        
-        
-class DefendCoolDown():
-    def __init__(self):
-        self.surface = pygame.Surface((100, 20))
-        self.surface.fill((100, 255, 100))
-        self.rect = self.surface.get_rect()    
-        self.prev_defend = 0
-        self.length = self.max_length = 100
-        self.cool_down = 5
-    
-    def update(self):
-        delay = (time.time()-self.prev_defend)
-        self.length = self.max_length * (1 - delay / self.cool_down)
-        if self.length < 0:
-            self.length = 0
-        self.rect.width = self.length
-        self.surface.fill((100, 255, 100))
-        pygame.draw.rect(self.surface, (255, 0, 0), self.rect)       
-        
-    def defend(self):
-        self.prev_defend = time.time()
-        
\ No newline at end of file
+
+
+# Seconds before an ability can be used again
+COOL_DOWN = 5
+
+# Bar size, and colours for the part that is ready and still cooling
+BAR_SIZE = (100, 20)
+READY_COLOR = (100, 255, 100)
+COOLING_COLOR = (255, 0, 0)
+
+# Bar frames rendered so far, keyed on size and colours
+FRAMES = {}
+
+
+class CoolDown():
+    def __init__(self, clock, period=COOL_DOWN):
+        """Time until an ability can be used again, read from a game clock.
+
+        clock provides time() in seconds, usually the simulation clock so
+        cooldowns pause and replay with the game.
+        """
+        self.clock = clock
+        self.period = period
+
+        # Abilities start ready however early the clock starts
+        self.last_used = float("-inf")
+
+    def ready(self):
+        return self.clock.time() - self.last_used >= self.period
+
+    def trigger(self):
+        """Use the ability if ready, returning whether it was."""
+        if not self.ready():
+            return False
+        self.last_used = self.clock.time()
+        return True
+
+    def remaining(self):
+        """Seconds left to wait, zero when ready."""
+        return max(self.period - (self.clock.time() - self.last_used), 0)
+
+
+class CoolDownBar():
+    def __init__(self, cool_down: CoolDown, size=BAR_SIZE):
+        """Bar showing the time left on a cooldown.
+
+        A frame is rendered once for every pixel of cooling length and
+        shared between bars of the same size, so drawing just picks one.
+        """
+        self.cool_down = cool_down
+        self.max_length = size[0]
+        self.frames = bar_frames(size)
+
+    @property
+    def length(self):
+        """Pixels of the bar still cooling down."""
+        fraction = self.cool_down.remaining() / self.cool_down.period
+        return round(self.max_length * fraction)
+
+    def surface(self):
+        return self.frames[self.length]
+
+
+def bar_frames(size, ready_color=READY_COLOR, cooling_color=COOLING_COLOR):
+    """Return a bar surface for every cooling length from 0 to full."""
+    key = (tuple(size), ready_color, cooling_color)
+    frames = FRAMES.get(key)
+    if frames is None:
+        width, height = size
+        frames = []
+        for length in range(width + 1):
+            surf = pygame.Surface(size)
+            surf.fill(ready_color)
+            surf.fill(cooling_color, (0, 0, length, height))
+            frames.append(surf)
+        FRAMES[key] = frames
+    return frames
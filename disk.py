@@ -0,0 +1,86 @@
+import concurrent.futures
+import queue
+import sys
+import threading
+import time
+import traceback
+
+
+# Jobs waiting before submit blocks the caller
+QUEUE_SIZE = 64
+
+
+class DiskWorker():
+    def __init__(self, queue_size=QUEUE_SIZE):
+        """Runs file reads and writes in order on one background thread.
+
+        Jobs are posted with submit and return a Future, so the game loop
+        never waits on the disk unless it asks for a result. The queue is
+        bounded, so a stalled disk blocks submit rather than using memory
+        without limit. Resources such as SQLite connections that may only
+        be used by one thread should only be touched from jobs. Errors are
+        printed as well as set on the job's Future, as most writes are
+        never waited on.
+        """
+        self.jobs = queue.Queue(queue_size)
+        self.thread = None
+        self.lock = threading.Lock()
+
+        # Jobs finished, seconds spent on them, deepest queue and
+        # seconds callers spent blocked on a full queue
+        self.done = 0
+        self.busy_time = 0.0
+        self.peak_depth = 0
+        self.blocked_time = 0.0
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+
+    def submit(self, function, *args, **kwargs):
+        """Queue function to be called on the worker thread."""
+        self.start()
+        future = concurrent.futures.Future()
+        start = time.perf_counter()
+        self.jobs.put((future, function, args, kwargs))
+        self.blocked_time += time.perf_counter() - start
+        self.peak_depth = max(self.peak_depth, self.jobs.qsize())
+        return future
+
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                self.jobs.task_done()
+                return
+            future, function, args, kwargs = job
+            if future.set_running_or_notify_cancel():
+                start = time.perf_counter()
+                try:
+                    future.set_result(function(*args, **kwargs))
+                except BaseException as error:
+                    traceback.print_exc(file=sys.stderr)
+                    future.set_exception(error)
+                self.busy_time += time.perf_counter() - start
+            self.done += 1
+            self.jobs.task_done()
+
+    def flush(self):
+        """Wait until every job submitted so far has finished."""
+        if self.thread is not None:
+            self.jobs.join()
+
+    def close(self):
+        """Finish queued jobs and stop the thread, which can be restarted."""
+        with self.lock:
+            if self.thread is None:
+                return
+            self.jobs.put(None)
+            self.thread.join()
+            self.thread = None
+
+
+# Worker shared by the whole game
+WORKER = DiskWorker()
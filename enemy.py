@@ -1,95 +1,303 @@
 import numpy as np
 import pygame
 import random
-import time
 
+import assets
+import pool
 
-def add_enemy(level, screen):
-    chance = random.random()
-    if chance < (level / 20):
-        return SineMissile(screen)
-    elif chance < (2 * level / 20):
-        return BoostMissile(screen)
+
+# Sine missiles tilt by at most arctan(1) in either direction
+SINE_MAX_ANGLE = 45
+
+# Kind codes stored by the missile engine
+STRAIGHT, SINE, BOOST = range(3)
+
+# Boost missiles speed up once left of this fraction of the screen
+BOOST_POINT = 3 / 4
+BOOST_SPEED = 30
+
+# Levels over which the chance of a sine missile, and again of a boost
+# missile, grows from nothing to every missile
+SPECIAL_LEVELS = 20
+
+# Free missiles of each class kept for reuse
+MISSILE_POOL_CAP = 64
+
+# Missiles in play from which one collision test over the engine's arrays
+# beats testing their rects one by one
+ARRAY_COLLIDE_COUNT = 600
+
+# Arrays held by the missile engine, one element per missile
+FIELDS = {
+    "x": float,
+    "y": float,
+    "width": float,
+    "height": float,
+    "speed": float,
+    "offset": float,
+    "angle": float,
+    "kind": np.int8,
+    "alive": bool,
+    }
+
+
+def to_pixels(values):
+    """Round like pygame does when floats are assigned to a Rect."""
+    return np.trunc(values + np.copysign(0.5, values)).astype(int)
+
+
+def add_enemy(level, screen, rng=random):
+    chance = rng.random()
+    if chance < (level / SPECIAL_LEVELS):
+        missile_class = SineMissile
+    elif chance < (2 * level / SPECIAL_LEVELS):
+        missile_class = BoostMissile
     else:
-        return Missile(screen)
+        missile_class = Missile
+    return POOLS[missile_class].acquire(screen, rng)
 
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, screen: pygame.Surface):
+class Enemy(pool.Pooled, pygame.sprite.Sprite):
+    def __init__(self, screen: pygame.Surface, rng=random):
         super(Enemy, self).__init__()
+        self.rect: pygame.Rect = None
+        self.reset(screen, rng)
+        
+    def reset(self, screen: pygame.Surface, rng=random):
+        """Set up as a new missile, including when recycled by a pool."""
         self.screen = screen
         self.screen_rect: pygame.Rect = screen.get_rect()
-        self.height = random.randint(0, self.screen_rect.height) 
+        self.height = rng.randint(0, self.screen_rect.height) 
         
         # Declare surf attribute and type for draw & place methods
         self.surf: pygame.Surface = None 
-        self.rect: pygame.Rect = None   
+        
+        # Size covering every surface drawn at the rect's top left
+        self.hit_size = None
+        
+        # Movement is owned by the engine once the missile is added to it
+        self.kind = STRAIGHT
+        self.offset = 0
+        self.engine: MissileEngine = None
+        self.slot = None
+            
+    @property
+    def mask(self):
+        return assets.mask("missile")
             
-    def draw(self):
-        self.screen.blit(self.surf, self.rect)
+    def draw(self, screen, dest=None):
+        """Draw at dest, the current rect unless an interpolated position."""
+        screen.blit(self.surf, self.rect if dest is None else dest)
         
     def place(self):
         """Place surface just past right edge of screen at random height."""
-        self.rect = self.surf.get_rect(topleft=(self.screen_rect.width, self.height)) 
-    
-    def update(self):
-        self.rect.move_ip(-self.speed, 0)
-        if self.rect.centerx < (SCREEN_WIDTH*3/4):
-            self.speed = 30
-        if self.rect.right < 0:
-            self.kill()                 
+        if self.rect is None:
+            self.rect = self.surf.get_rect()
+        if self.hit_size is None:
+            self.hit_size = self.rect.size
+        self.rect.topleft = (self.screen_rect.width, self.height)
+        
+    def kill(self):
+        """Remove from groups, returning to the pool once off the engine.
+        
+        The engine still holds a killed missile's slot until it culls it,
+        so the missile cannot be recycled before then.
+        """
+        super(Enemy, self).kill()
+        if self.engine is not None:
+            self.engine.alive[self.slot] = False
+        else:
+            self.release()
             
 
 class Missile(Enemy):
-    def __init__(self, screen):
-        super(Missile, self).__init__(screen)
-        self.surf = pygame.image.load("resources/missile.png").convert()
-        self.surf.set_colorkey((255, 255, 255), pygame.RLEACCEL)        
-        self.speed = random.randint(10, 25)
+    def reset(self, screen, rng=random):
+        super(Missile, self).reset(screen, rng)
+        self.surf = assets.get("missile")
+        self.speed = rng.randint(10, 25)
         self.place()
-        
-    def update(self):
-        self.rect.move_ip(-self.speed, 0)
-        if self.rect.right < 0:
-            self.kill()
 
 
 class SineMissile(Enemy):
-    def __init__(self, screen):
-        super(SineMissile, self).__init__(screen)
-        self.surf = pygame.image.load("resources/missile.png").convert()
-        self.surf.set_colorkey((255, 255, 255), pygame.RLEACCEL)          
+    def reset(self, screen, rng=random):
+        super(SineMissile, self).reset(screen, rng)
+        self.surf = assets.get("missile")
+        self.rotations = assets.rotated("missile", SINE_MAX_ANGLE)
+        self.hit_size = self.rotations.size
+        self.kind = SINE
         self.speed = 10
-        self.angle = 0
-        self.offset = 2 * np.pi * np.random.random()   
+        self.offset = 2 * np.pi * rng.random()   
         self.place()
         
-    def update(self):
-        self.rect.move_ip(-self.speed, 0)
-        t = time.time() % (2*np.pi)
-        vy = np.sin(4*(t+self.offset))
-        self.rect.move_ip(0, self.speed*vy)
-        self.angle = np.arctan(vy) * 180 / np.pi        
-        if self.rect.right < 0:
-            self.kill()
+    @property
+    def angle(self):
+        return self.engine.angle[self.slot] if self.engine else 0
+    
+    @property
+    def mask(self):
+        return self.rotations.mask(self.angle)
             
-    def draw(self):
-        rotated_surf = pygame.transform.rotate(self.surf, self.angle)
-        self.screen.blit(rotated_surf, self.rect)    
+    def draw(self, screen, dest=None):
+        rotated_surf = self.rotations.get(self.angle)
+        screen.blit(rotated_surf, self.rect if dest is None else dest)    
             
     
 class BoostMissile(Enemy):
-    def __init__(self, screen):
-        super(BoostMissile, self).__init__(screen)
-        self.surf = pygame.image.load("resources/missile.png").convert()
-        self.surf.set_colorkey((255, 255, 255), pygame.RLEACCEL)             
+    def reset(self, screen, rng=random):
+        super(BoostMissile, self).reset(screen, rng)
+        self.surf = assets.get("missile")
+        self.kind = BOOST
         self.speed = 5
-        self.boosted = False
         self.place()
+
+
+class MissileEngine():
+    def __init__(self, screen_rect: pygame.Rect, bounds: pygame.Rect = None, capacity=64):
+        """Moves every missile at once from contiguous arrays.
+        
+        Missile sprites are views onto one slot each, so the engine writes
+        their rects back after every step for drawing and collisions.
+        Missiles are killed once their rects no longer overlap bounds,
+        which defaults to the screen.
+        """
+        self.screen_rect = screen_rect
+        self.bounds = bounds or screen_rect
+        self.count = 0
+
+        # Most any missile's drawn surface reaches right of and below its
+        # rect, as rotated missiles are drawn from the rect's top left
+        self.reach = (0, 0)
+        self.sprites = []
+        self.allocate(capacity)
+        
+    def allocate(self, capacity):
+        """Create arrays for capacity missiles, keeping existing ones."""
+        for name, dtype in FIELDS.items():
+            array = np.zeros(capacity, dtype)
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        
+    def add(self, missile: Enemy):
+        """Take over movement of a placed missile."""
+        if self.count == len(self.x):
+            self.allocate(2 * len(self.x))
+        i = self.count
+        self.x[i], self.y[i] = missile.rect.topleft
+        self.width[i], self.height[i] = missile.rect.size
+        self.speed[i] = missile.speed
+        self.offset[i] = missile.offset
+        self.angle[i] = 0
+        self.kind[i] = missile.kind
+        self.alive[i] = True
+        missile.engine, missile.slot = self, i
+        hit_width, hit_height = missile.hit_size
+        self.reach = (max(self.reach[0], hit_width - missile.rect.width),
+                      max(self.reach[1], hit_height - missile.rect.height))
+        self.sprites.append(missile)
+        self.count += 1
+        
+    def step(self, now):
+        """Advance all missiles by one frame at time now in seconds."""
+        n = self.count
+        x, y, speed = self.x[:n], self.y[:n], self.speed[:n]
+        kind = self.kind[:n]
+        
+        # Boost missiles speed up past the boost point
+        boost = (kind == BOOST) & (x < self.screen_rect.width * BOOST_POINT)
+        speed[boost] = BOOST_SPEED
+        x -= speed
+        
+        # Sine missiles weave up and down, pointing along their path
+        sine = np.flatnonzero(kind == SINE)
+        if len(sine):
+            t = now % (2*np.pi)
+            vy = np.sin(4*(t+self.offset[sine]))
+            y[sine] += speed[sine] * vy
+            self.angle[sine] = np.degrees(np.arctan(vy))
         
-    def update(self):
-        if not self.boosted:
-            if self.rect.left < (self.screen_rect.width * 3 / 4):
-                self.speed = 30
-        self.rect.move_ip(-self.speed, 0)
-    
\ No newline at end of file
+        self.cull()
+        
+        # Write positions back to the sprite views
+        n = self.count
+        lefts, tops = self.x[:n].tolist(), self.y[:n].tolist()
+        for missile, left, top in zip(self.sprites, lefts, tops):
+            missile.rect.topleft = (left, top)
+            
+    def velocities(self, now):
+        """Pixels each missile will move in a step at time now, as x and y arrays."""
+        n = self.count
+        x, speed, kind = self.x[:n], self.speed[:n], self.kind[:n]
+        boost = (kind == BOOST) & (x < self.screen_rect.width * BOOST_POINT)
+        vx = -np.where(boost, BOOST_SPEED, speed)
+        vy = np.zeros(n)
+        sine = kind == SINE
+        t = now % (2*np.pi)
+        vy[sine] = speed[sine] * np.sin(4*(t+self.offset[:n][sine]))
+        return vx, vy
+
+    def rects(self):
+        """Integer left, top, width and height arrays matching the rects."""
+        n = self.count
+        return (to_pixels(self.x[:n]), to_pixels(self.y[:n]),
+                self.width[:n].astype(int), self.height[:n].astype(int))
+            
+    def colliding(self, rect: pygame.Rect):
+        """Return the missiles whose drawn surfaces may overlap rect, in
+        slot order.
+
+        Rects are tested against rect grown up and left by the reach, so
+        rotated missiles are found too. Up to ARRAY_COLLIDE_COUNT missiles
+        their rects are tested in turn, beyond that in one test over the
+        arrays. Missiles killed since the last cull are left out.
+        """
+        reach_x, reach_y = self.reach
+        rect = pygame.Rect(rect.left - reach_x, rect.top - reach_y,
+                           rect.width + reach_x, rect.height + reach_y)
+        if self.count < ARRAY_COLLIDE_COUNT:
+            alive = self.alive
+            hits = rect.collidelistall([missile.rect for missile in self.sprites])
+            return [self.sprites[i] for i in hits if alive[i]]
+        left, top, width, height = self.rects()
+        hit = (self.alive[:self.count]
+               & (left < rect.right) & (left + width > rect.left)
+               & (top < rect.bottom) & (top + height > rect.top))
+        return [self.sprites[i] for i in np.flatnonzero(hit).tolist()]
+
+    def clear(self):
+        """Kill every missile, returning each to its pool."""
+        for missile in self.sprites:
+            missile.engine = None
+            missile.kill()
+        self.sprites = []
+        self.count = 0
+
+    def cull(self):
+        """Remove killed missiles and those outside the bounds."""
+        n = self.count
+        left, top, width, height = self.rects()
+        b = self.bounds
+        keep = (self.alive[:n]
+                & (left + width > b.left) & (left < b.right)
+                & (top + height > b.top) & (top < b.bottom))
+        if keep.all():
+            return
+        kept, culled = [], []
+        for missile, keep_missile in zip(self.sprites, keep.tolist()):
+            (kept if keep_missile else culled).append(missile)
+        for missile in culled:
+            missile.engine = None
+            missile.kill()
+        self.sprites = kept
+        self.count = len(self.sprites)
+        for name in FIELDS:
+            array = getattr(self, name)
+            array[:self.count] = array[:n][keep]
+        for i, missile in enumerate(self.sprites):
+            missile.slot = i
+
+
+# Recycled missiles of each class
+POOLS = {
+    missile_class: pool.SpritePool(missile_class, MISSILE_POOL_CAP)
+    for missile_class in (Missile, SineMissile, BoostMissile)}
@@ -0,0 +1,230 @@
+"""Reinforcement learning environments wrapping the headless simulation.
+
+DodgeEnv plays one game through reset() and step(action), in the style of
+Gym. VectorEnv steps many independent games in one call, stacking their
+observations and starting a new game whenever one ends.
+
+Actions are the one byte inputs recorded by replays: held arrow keys in
+the low bits and FLASH and DEFEND flags above them, see replay.encode.
+Observations are dicts of NumPy arrays:
+    player    x, y, flash and defend cooldown seconds, shield steps, level
+    missiles  nearest missiles as offsets from the player, velocity in
+              pixels per step and 1 for a missile or 0 for padding
+    frame     optional downscaled RGB frame as height, width, 3
+Observation arrays are reused between steps, so copy them to keep them.
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+import pygame
+
+import replay
+import renderer
+import simulation
+
+
+# Distinct action bytes
+N_ACTIONS = 1 << (replay.ACTION_SHIFT + 2)
+
+# Missiles included in each observation, nearest first
+NEAREST = 8
+
+# Numbers describing the player and each missile
+PLAYER_FEATURES = 6
+MISSILE_FEATURES = 5
+
+# Reward for each step survived, for each point scored and for dying
+STEP_REWARD = 1.0
+SCORE_REWARD = 0.1
+DEATH_REWARD = -100.0
+
+
+def observation_buffers(nearest=NEAREST, frame_size=None, batch=()):
+    """Arrays holding an observation, with leading batch dimensions."""
+    batch = tuple(batch)
+    buffers = {
+        "player": np.zeros(batch + (PLAYER_FEATURES,), np.float32),
+        "missiles": np.zeros(batch + (nearest, MISSILE_FEATURES), np.float32),
+        }
+    if frame_size:
+        width, height = frame_size
+        buffers["frame"] = np.zeros(batch + (height, width, 3), np.uint8)
+    return buffers
+
+
+class DodgeEnv():
+    def __init__(self, seed=None, nearest=NEAREST, frame_size=None,
+                 max_steps=None, observation=None):
+        """One headless game played an action at a time.
+
+        Games are seeded from a generator seeded with seed, so a run of
+        resets is repeatable. frame_size is the width and height frames are
+        scaled to, or None to leave frames out. Games are truncated after
+        max_steps if given. observation holds arrays from
+        observation_buffers to write observations into.
+        """
+        if pygame.display.get_surface() is None:
+            simulation.init_headless()
+        self.rng = random.Random(seed)
+        self.nearest = nearest
+        self.frame_size = frame_size
+        self.max_steps = max_steps
+        self.observation = observation or observation_buffers(nearest, frame_size)
+        self.sim: simulation.Simulation = None
+        self.steps = 0
+
+        # Full size frame drawn without a display, and the scaled copy
+        if frame_size:
+            size = pygame.display.get_surface().get_size()
+            self.renderer = renderer.Renderer(pygame.Surface(size))
+            self.small = pygame.Surface(frame_size)
+
+    def reset(self, seed=None):
+        """Start a new game, returning the observation and info."""
+        if seed is None:
+            seed = self.rng.randrange(2**32)
+        if self.sim is not None:
+            self.sim.release_sprites()
+        self.sim = simulation.Simulation(clouds=False, seed=seed)
+        self.sim.skip_intro()
+        self.steps = 0
+        return self.observe(), self.info()
+
+    def step(self, action):
+        """Play one step, returning observation, reward, whether the game
+        ended, whether it was cut short and info."""
+        sim = self.sim
+        score = sim.score
+        sim.step(*replay.decode(int(action)))
+        self.steps += 1
+
+        terminated = not sim.alive
+        truncated = not terminated and self.max_steps is not None and self.steps >= self.max_steps
+        reward = STEP_REWARD + SCORE_REWARD * (sim.score - score)
+        if terminated:
+            reward = DEATH_REWARD
+        return self.observe(), reward, terminated, truncated, self.info()
+
+    def info(self):
+        return {"score": self.sim.score, "level": self.sim.level,
+                "steps": self.steps, "seed": self.sim.seed}
+
+    def observe(self):
+        """Write the current observation into the observation arrays."""
+        sim = self.sim
+        player = sim.player
+        self.observation["player"][:] = (
+            player.rect.centerx, player.rect.centery,
+            player.flash_cooldown.remaining(), player.defend_cooldown.remaining(),
+            player.is_defending, sim.level)
+
+        # Nearest missiles to the player's centre, padded with zeros,
+        # leaving out those the shield killed this step
+        missiles = self.observation["missiles"]
+        missiles[:] = 0
+        engine = sim.missiles
+        live = np.flatnonzero(engine.alive[:engine.count])
+        if len(live):
+            dx = engine.x[live] + engine.width[live] / 2 - player.rect.centerx
+            dy = engine.y[live] + engine.height[live] / 2 - player.rect.centery
+            distance = dx*dx + dy*dy
+            if len(live) > self.nearest:
+                nearest = np.argpartition(distance, self.nearest)[:self.nearest]
+                nearest = nearest[np.argsort(distance[nearest])]
+            else:
+                nearest = np.argsort(distance)
+            vx, vy = engine.velocities(sim.clock.time() + simulation.STEP)
+            vx, vy = vx[live], vy[live]
+            m = len(nearest)
+            missiles[:m, 0] = dx[nearest]
+            missiles[:m, 1] = dy[nearest]
+            missiles[:m, 2] = vx[nearest]
+            missiles[:m, 3] = vy[nearest]
+            missiles[:m, 4] = 1
+
+        if self.frame_size:
+            self.draw_frame()
+        return self.observation
+
+    def draw_frame(self):
+        """Draw the game without clouds or HUD and scale it into the frame."""
+        sim = self.sim
+        self.renderer.begin()
+        sim.player.draw(self.renderer)
+        self.renderer.draw_group(sim.balloons)
+        for enemy in sim.enemies:
+            enemy.draw(self.renderer)
+        pygame.transform.smoothscale(self.renderer.screen, self.frame_size, self.small)
+        self.observation["frame"][:] = pygame.surfarray.pixels3d(self.small).swapaxes(0, 1)
+
+
+class VectorEnv():
+    def __init__(self, n_envs, seed=None, **options):
+        """n_envs independent games stepped together.
+
+        Observations are stacked along a first axis of n_envs and games that
+        end are reset at once, their last observation kept in their info as
+        final_observation. options are passed to every DodgeEnv.
+        """
+        self.observation = observation_buffers(
+            options.get("nearest", NEAREST), options.get("frame_size"), (n_envs,))
+        self.envs = [
+            DodgeEnv(seed=None if seed is None else f"{seed}:{i}", **options,
+                     observation={name: array[i] for name, array in self.observation.items()})
+            for i in range(n_envs)]
+        self.rewards = np.zeros(n_envs, np.float32)
+        self.terminated = np.zeros(n_envs, bool)
+        self.truncated = np.zeros(n_envs, bool)
+
+    def __len__(self):
+        return len(self.envs)
+
+    def reset(self, seed=None):
+        """Start every game, seeding game i with seed + i if seed is given."""
+        infos = [env.reset(None if seed is None else seed + i)[1]
+                 for i, env in enumerate(self.envs)]
+        return self.observation, infos
+
+    def step(self, actions):
+        """Play one step of every game with an action each."""
+        infos = []
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            _, reward, terminated, truncated, info = env.step(action)
+            if terminated or truncated:
+                info["final_observation"] = {
+                    name: array.copy() for name, array in env.observation.items()}
+                env.reset()
+            self.rewards[i] = reward
+            self.terminated[i] = terminated
+            self.truncated[i] = truncated
+            infos.append(info)
+        return self.observation, self.rewards, self.terminated, self.truncated, infos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time environment steps with random actions.")
+    parser.add_argument("--envs", type=int, default=16)
+    parser.add_argument("--steps", type=int, default=5000, help="steps of every game")
+    parser.add_argument("--frame-size", type=int, nargs=2, metavar=("WIDTH", "HEIGHT"))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    frame_size = tuple(args.frame_size) if args.frame_size else None
+    envs = VectorEnv(args.envs, args.seed, frame_size=frame_size)
+    envs.reset(args.seed)
+    rng = np.random.default_rng(args.seed)
+    episodes = 0
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        _, _, terminated, truncated, _ = envs.step(rng.integers(N_ACTIONS, size=len(envs)))
+        episodes += np.count_nonzero(terminated | truncated)
+    seconds = time.perf_counter() - start
+    total = args.steps * len(envs)
+    print(f"{total} steps in {seconds:.2f} s ({total / seconds:.0f} steps/s), "
+          f"{episodes} games ended")
+
+
+if __name__ == "__main__":
+    main()
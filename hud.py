@@ -0,0 +1,87 @@
+import collections
+import pygame
+
+import cooldown
+
+
+# Text colour used by the HUD and menus
+BLACK = (0, 0, 0)
+
+# Number of rendered text surfaces kept before the oldest is dropped
+CACHE_SIZE = 256
+
+# Font sizes
+LABEL_SIZE = 24
+STATS_SIZE = 38
+
+
+class TextCache():
+    def __init__(self, max_size=CACHE_SIZE):
+        """Fonts and rendered text surfaces shared by every screen."""
+        self.max_size = max_size
+        self.fonts = {}
+
+        # Surfaces keyed on (text, size, color), least recently used first
+        self.surfaces = collections.OrderedDict()
+
+    def font(self, size):
+        """Return the default font at the given size, creating it once."""
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def render(self, text, size, color=BLACK):
+        """Return a shared antialiased surface for the text."""
+        key = (text, size, color)
+        surf = self.surfaces.get(key)
+        if surf is None:
+            surf = self.font(size).render(text, True, color)
+            self.surfaces[key] = surf
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surf
+
+
+class Hud():
+    def __init__(self, player, text=None):
+        """Cooldown bars, score and level drawn over the game."""
+        self.text = text or TEXT
+
+        # Labelled bars for each ability, labels rendered once
+        self.bars = []
+        self.add_bar("Flash", player.flash_cooldown)
+        self.add_bar("Defend", player.defend_cooldown)
+
+        # Score and level are only re-rendered when they change
+        self.score = self.level = None
+        self.score_surf = self.level_surf = None
+
+    def add_bar(self, label, cool_down: cooldown.CoolDown):
+        """Show a cooldown bar below those already added."""
+        label_surf = self.text.render(label, LABEL_SIZE)
+        self.bars.append((cooldown.CoolDownBar(cool_down), label_surf))
+
+    def update(self, score, level):
+        """Update any text whose value has changed."""
+        if score != self.score:
+            self.score = score
+            self.score_surf = self.text.render(f"Score: {score}", STATS_SIZE)
+        if level != self.level:
+            self.level = level
+            self.level_surf = self.text.render(f"Level: {level}", STATS_SIZE)
+
+    def draw(self, renderer):
+        top = 5
+        for bar, label_surf in self.bars:
+            renderer.blit(bar.surface(), (10, top))
+            renderer.blit(label_surf, (12, top + 2))
+            top += 25
+        renderer.blit(self.score_surf, (10, top))
+        renderer.blit(self.level_surf, (10, top + 25))
+
+
+# Cache shared by the whole game
+TEXT = TextCache()
@@ -0,0 +1,106 @@
+import math
+
+import pygame
+
+
+# Distance sprites may stray past the right, top and bottom of the screen,
+# covering spawns just off the right and sine missiles, which weave up to
+# 150 pixels from where they start before coming back
+BOUNDS_MARGIN = 200
+
+# Sprites a group may hold while checking for leaks, beyond those its
+# spawn rate keeps alive
+LIVE_HEADROOM = 100
+
+
+class LeakError(AssertionError):
+    pass
+
+
+class Lifecycle():
+    def __init__(self, screen_rect: pygame.Rect, margin=BOUNDS_MARGIN, check=False):
+        """Owns every spawned sprite and kills those leaving the bounds.
+
+        Sprites live in named groups as well as all_sprites. Everything
+        moves left, so the bounds are the screen widened by margin on every
+        side but the left. With check set, every cull also verifies that
+        no sprite escaped culling or its group and that no group holds
+        more sprites than its limit, raising LeakError otherwise. A group's
+        limit is LIVE_HEADROOM more than the sprites spawned over the
+        longest a sprite can stay in bounds, so it rises with the spawn
+        rate.
+        """
+        self.bounds = pygame.Rect(
+            0, -margin, screen_rect.width + margin, screen_rect.height + 2*margin)
+        self.check = check
+        self.all_sprites = pygame.sprite.Group()
+        self.groups = {}
+
+        # Groups whose sprites are culled elsewhere against the same bounds
+        self.culled_elsewhere = set()
+
+        # Largest size reached by each group
+        self.peaks = {}
+
+        # Seconds a sprite of each group can stay in bounds, and the most
+        # sprites each group may hold
+        self.lifetimes = {}
+        self.limits = {}
+
+    def add_group(self, name, cull=True, lifetime=None):
+        """Create a group of managed sprites, culled here unless cull is False.
+
+        lifetime is the most seconds a sprite can stay in bounds, needed
+        to set the group's spawn period.
+        """
+        group = self.groups[name] = pygame.sprite.Group()
+        self.peaks[name] = 0
+        self.lifetimes[name] = lifetime
+        self.limits[name] = LIVE_HEADROOM
+        if not cull:
+            self.culled_elsewhere.add(name)
+        return group
+
+    def set_spawn_period(self, name, period):
+        """Raise or lower a group's limit for a sprite spawned every period s."""
+        alive = math.ceil(self.lifetimes[name] / period)
+        self.limits[name] = alive + LIVE_HEADROOM
+
+    def spawn(self, sprite: pygame.sprite.Sprite, name):
+        """Add a sprite to a named group and to all_sprites."""
+        self.groups[name].add(sprite)
+        self.all_sprites.add(sprite)
+        return sprite
+
+    def in_bounds(self, rect: pygame.Rect):
+        return self.bounds.colliderect(rect)
+
+    def cull(self):
+        """Kill sprites outside the bounds and record group sizes."""
+        for name, group in self.groups.items():
+            if name not in self.culled_elsewhere:
+                for sprite in group.sprites():
+                    if not self.bounds.colliderect(sprite.rect):
+                        sprite.kill()
+            self.peaks[name] = max(self.peaks[name], len(group))
+        if self.check:
+            self.verify()
+
+    def counts(self):
+        """Live sprites in each group, keyed on name."""
+        return {name: len(group) for name, group in self.groups.items()}
+
+    def verify(self):
+        """Raise LeakError if any sprite has escaped being culled."""
+        grouped = set()
+        for name, group in self.groups.items():
+            limit = self.limits[name]
+            if len(group) > limit:
+                raise LeakError(f"{len(group)} {name} alive, limit {limit}")
+            for sprite in group:
+                if not self.bounds.colliderect(sprite.rect):
+                    raise LeakError(f"{name} sprite at {sprite.rect} out of bounds")
+            grouped.update(group)
+        untracked = len(self.all_sprites) - len(grouped)
+        if untracked:
+            raise LeakError(f"{untracked} sprites in no managed group")
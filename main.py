@@ -1,20 +1,21 @@
 # Import the packages needed for this code
-import numpy as np
-import pickle
+import argparse
 import pygame
-import random
-import time
 
 # Import other modules from this project
-import balloon
-import cooldown
-import cloud
-import enemy
-import player
+import capture
+import disk
+import hud
+import menus
+import profiler
+import renderer
+import replay
+import scores
+import simulation
+import strobe
 
 # Import commonly used objects from pygame
 from pygame.locals import(
-    RLEACCEL,
     K_UP,
     K_DOWN,
     K_LEFT,
@@ -26,6 +27,7 @@ from pygame.locals import(
     K_f,
     K_d,
     K_SPACE,
+    K_F3,
     KEYDOWN,
     QUIT,
     )
@@ -36,394 +38,332 @@ pygame.init()
 
 
 # Screen dimensions
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
+SCREEN_WIDTH = simulation.SCREEN_WIDTH
+SCREEN_HEIGHT = simulation.SCREEN_HEIGHT
 
-# Frame speed
-FPS = 30
+# Simulation steps per second, and frames drawn per second by default
+FPS = simulation.FPS
+RENDER_FPS = 60
+
+# Most game time run in one frame, so a slow machine slows the game down
+# rather than falling ever further behind
+MAX_FRAME_TIME = 5 * simulation.STEP
 
 # Game clock
 CLOCK = pygame.time.Clock()
 
-# Speeds in pixels per frame
-PLAYER_SPEED = 10
-CLOUD_SPEED = 4
-BALLOON_RISE_SPEED = 3
-
-# Time between events in ms
-BALLOON_PERIOD = 4e3
-CLOUD_PERIOD = 3e2
-MISSILE_PERIOD = 1e3
-DIFFICULTY_PERIOD = 1e4
-
-# Custom pygame events & timings
-ADD_ENEMY = pygame.USEREVENT + 1
-ADD_CLOUD = pygame.USEREVENT + 2
-ADD_BALLOON = pygame.USEREVENT + 3
-INCR_DIFF = pygame.USEREVENT + 4
+# Scenes the game loop moves between
+INTRO, PLAYING, PAUSED, NAME_ENTRY, GAME_OVER, HIGH_SCORES = range(6)
 
 
 def main():
-    loop = GameLoop()
+    parser = argparse.ArgumentParser(description="Dodge the missiles.")
+    parser.add_argument(
+        "--dirty", action="store_true",
+        help="only push changed areas of the screen to the display, "
+             "mostly under the drifting clouds")
+    parser.add_argument(
+        "--seed", type=int,
+        help="seed for every game, random for each game if not given")
+    parser.add_argument(
+        "--record", metavar="PATH",
+        help="save a replay of each game to PATH.1, PATH.2 and so on")
+    parser.add_argument(
+        "--profile", metavar="PATH",
+        help="record frame timings and write them to a .csv or .json on exit")
+    parser.add_argument(
+        "--fps", type=int, default=RENDER_FPS,
+        help=f"frames drawn per second, 0 for uncapped (default {RENDER_FPS}),"
+             f" the game itself always runs at {FPS} steps per second")
+    parser.add_argument(
+        "--blend-strobe", action="store_true",
+        help="tint strobe levels with blend fills instead of an overlay")
+    parser.add_argument(
+        "--capture", metavar="PATH",
+        help="record every frame to PATH, a directory for png frames")
+    parser.add_argument(
+        "--capture-format", choices=capture.FORMATS, default="png",
+        help="png files, one raw RGB file, or raw frames piped to an encoder")
+    parser.add_argument(
+        "--capture-command", default=capture.ENCODER,
+        help="encoder for pipe capture, formatted with {width}, {height},"
+             " {fps} and {path}")
+    args = parser.parse_args()
+    
+    # Frame timings, shown in game with F3
+    frame_profiler = profiler.Profiler(enabled=args.profile is not None)
+    loop = GameLoop(
+        dirty=args.dirty, seed=args.seed, record=args.record,
+        profile=frame_profiler, blend_strobe=args.blend_strobe)
+    
+    # Frames written in the background, dropped if writing falls behind
+    frame_capture = None
+    if args.capture:
+        frame_capture = capture.FrameCapture(
+            loop.screen, args.capture, args.capture_format,
+            args.fps or RENDER_FPS, command=args.capture_command)
+    CLOCK.tick()
     while loop.quit is False:
+        frame_time = CLOCK.tick(args.fps) / 1e3
+        frame_profiler.begin_frame()
+        loop.narrow_phase.begin_frame()
         loop.check_events()
-        if loop.pause is False:
-            if loop.alive:
-                loop.run_frame()
-            else:
-                loop.end_screen()
-        CLOCK.tick(FPS)  
+        frame_profiler.mark(profiler.EVENTS)
+        loop.run_scene(frame_time)
+        if frame_capture:
+            frame_capture.grab(loop.screen)
+            frame_profiler.mark(profiler.CAPTURE)
+        frame_profiler.end_frame(loop.profile_counts())
+    loop.save_replay()
+    if args.profile:
+        disk.WORKER.submit(frame_profiler.export, args.profile)
+    
+    # Finish writing replays, scores, timings and frames before exiting
+    disk.WORKER.close()
+    if frame_capture:
+        frame_capture.close()
+        print(frame_capture.report())
 
 
-class GameLoop():
-    def __init__(self):
-        """Create the loop that runs the game."""
-        # Loop flags
-        self.quit = False
-        self.pause = False
-        self.alive = True
+class GameLoop(simulation.Simulation):
+    def __init__(self, dirty=False, seed=None, record=None, profile=None,
+                 blend_strobe=False, game=1):
+        """Create the loop that runs the game, game counting from 1."""
+        # Options kept when the game is reset
+        self.options = dict(
+            dirty=dirty, seed=seed, record=record, profile=profile,
+            blend_strobe=blend_strobe)
+        self.game = game
         
-        # Reset event flags
-        reset_events()
+        # Loop flag and current scene, starting with the player flying in
+        self.quit = False
+        self.scene = INTRO
         
         # Create game screen
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.renderer = renderer.Renderer(self.screen, dirty)
+        self.strobe = strobe.Strobe(self.screen.get_size(), blend_strobe)
         
-        # Create player
-        self.player = player.Player()
-        self.all_sprites = pygame.sprite.Group()
-        self.all_sprites.add(self.player)
+        # Game state, sprites and spawn schedule
+        super().__init__(seed=seed, profile=profile)
         
-        # Non-player sprite groups
-        self.balloons = pygame.sprite.Group()
-        self.back_clouds = pygame.sprite.Group()
-        self.front_clouds = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
+        # Flash and defend presses waiting for the next step
+        self.actions = 0
         
-        # Player score
-        self.score = 0           
-
-        # Set difficulty level & time between missiles in ms
-        self.level = 1
-        self.missile_period = int(1e3)
-        pygame.time.set_timer(ADD_ENEMY, self.missile_period)
+        # Game time not yet stepped, and sprite positions before the last step
+        self.accumulator = 0.0
+        self.previous = {}
+        
+        # Name typed and best scores, fetched in the background when the
+        # player loses
+        self.name_entry = menus.NameEntry(self.screen.get_size())
+        self.name = ""
+        self.high_scores = None
+        self.top_scores = None
+        self.table_shown = False
+        
+        # Inputs for each step, saved when the game ends
+        self.replay = replay.Replay(self.seed) if record else None
         
-        self.flash_cooldown = cooldown.FlashCoolDown()
-        self.defend_cooldown = cooldown.DefendCoolDown()
-        self.starting_animation()
+        # Cooldown bars, score and level
+        self.hud = hud.Hud(self.player)
+        self.hud.update(self.score, self.level)
+        self.scatter_clouds()
         
     def check_events(self):
         """Respond to all events raised this frame."""
         for event in pygame.event.get():
             
+            # Check for window closed        
+            if event.type == QUIT:
+                self.quit = True
+            
             # Check valid key presses
-            if event.type == KEYDOWN:
-                    
-                if event.key == K_SPACE or event.key == K_f:
-                    if self.player.flash():
-                        self.flash_cooldown.flash()
-                        
-                # Defend if d key
-                if event.key == K_d:
-                    if not self.player.defend_cooldown_remaining():
-                        self.player.defend()
-                        self.defend_cooldown.defend()
+            elif event.type == KEYDOWN:
+                
+                # Show or hide frame timings if F3
+                if event.key == K_F3:
+                    self.profiler.toggle()
+                
+                # Typed keys go to the name, whatever they are
+                elif self.scene == NAME_ENTRY:
+                    self.enter_name(event)
                 
                 # Quit if esc key
                 elif event.key == K_ESCAPE:
                     self.quit = True
                 
-                # Reset if r key
-                elif event.key == K_r:
-                    self.__init__()
+                # Reset if r key, or enter once the game is over
+                elif event.key == K_r or (
+                        event.key == K_RETURN and not self.alive):
+                    self.reset()
                     break
                 
-                # Pause if p key
-                elif event.key == K_p:
-                    if self.alive:
-                        self.pause = not self.pause
-                
-                # Pause or reset if enter key
-                elif event.key == K_RETURN:
-                    if self.alive:
-                        self.pause = not self.pause
-                    else:
-                        self.__init__()
-                        break
-            
-            # Check for window closed        
-            elif event.type == QUIT:
-                self.quit = True
-            
-            # Create a new enemy and add to sprite groups            
-            elif event.type == ADD_ENEMY:
-                if not self.pause:
-                    new_enemy = enemy.add_enemy(self.level, self.screen)
-                    self.enemies.add(new_enemy)
-                    self.all_sprites.add(new_enemy)
-            
-            # Create a new cloud and add to groups    
-            elif event.type == ADD_CLOUD:
-                if not self.pause:
-                    new_cloud = cloud.Cloud()
-                    self.all_sprites.add(new_cloud)
-                    if random.random() < 0.5:
-                        new_cloud.speed = int(0.5*new_cloud.speed)
-                        self.back_clouds.add(new_cloud)
-                    else:
-                        new_cloud.surf.set_alpha(140)
-                        self.front_clouds.add(new_cloud)
+                # Pause if p or enter key
+                elif event.key in (K_p, K_RETURN):
+                    if self.scene == PLAYING:
+                        self.scene = PAUSED
+                    elif self.scene == PAUSED:
+                        self.scene = PLAYING
+                        self.accumulator = 0.0
                 
-            # Create a new balloon and add to groups
-            elif event.type == ADD_BALLOON:
-                if not self.pause:
-                    new_balloon = balloon.Balloon()
-                    self.balloons.add(new_balloon)
-                    self.all_sprites.add(new_balloon)
+                # Flash if space or f key, defend if d key
+                elif self.scene == PLAYING:
+                    if event.key in (K_SPACE, K_f):
+                        self.actions |= simulation.FLASH
+                    elif event.key == K_d:
+                        self.actions |= simulation.DEFEND
                 
-            # Increase difficulty by decreasing missile period
-            elif event.type == INCR_DIFF:
-                if not self.pause:
-                    self.missile_period *= 0.8
-                    pygame.time.set_timer(ADD_ENEMY, int(self.missile_period))     
-                    self.level += 1
+    def reset(self):
+        """Start a new game with the same options."""
+        self.save_replay()
+        self.release_sprites()
+        self.__init__(game=self.game + 1, **self.options)
                 
-    def run_frame(self):
-        """Run one frame of the game."""
-        self.update_sprites()
-        self.check_collisions()
-        self.draw_screen()
-        if not self.alive:
-            self.end_screen()
-
-    def check_collisions(self):
-        """Check for collions with player."""
-        # Check if any enemies have collided with player
-        missile = pygame.sprite.spritecollideany(self.player, self.enemies)
-        if missile:
-            if self.player.is_defending:
-                missile.kill()
-                self.score += 5
-            else:   
-                self.player_loses(missile)
+    def run_scene(self, frame_time=simulation.STEP):
+        """Run one frame of the current scene, frame_time seconds long.
+        
+        Paused and game over scenes leave the last frame on the display,
+        and the high score table is drawn once, as soon as the best scores
+        have been fetched.
+        """
+        if self.scene == INTRO:
+            self.run_intro(frame_time)
+        elif self.scene == PLAYING:
+            self.run_frame(frame_time)
+        elif self.scene == NAME_ENTRY:
+            self.name_entry.draw(self.screen, self.score)
+            self.flip()
+        elif self.scene == HIGH_SCORES and not self.table_shown:
+            if not self.top_scores.done():
+                return
+            self.rank_score()
+            menus.draw_high_scores(self.screen, self.high_scores)
+            self.table_shown = True
+            self.flip()
             
-        # Check if any balloons have collided with player
-        balloon = pygame.sprite.spritecollideany(self.player, self.balloons)
-        if balloon:
-            self.score += 10 + (self.level-1) * 2
-            balloon.kill()
-
-    def update_sprites(self):
-        """Update all sprites."""
-        # Get keys pressed by user at start of frame
+    def flip(self):
+        """Push a menu frame drawn straight onto the screen."""
+        self.profiler.mark(profiler.DRAW)
+        pygame.display.flip()
+        self.profiler.mark(profiler.FLIP)
+            
+    def run_intro(self, frame_time=simulation.STEP):
+        """Fly the player in a step at a time, then start playing."""
+        self.accumulator = min(self.accumulator + frame_time, MAX_FRAME_TIME)
+        while self.accumulator >= simulation.STEP:
+            self.accumulator -= simulation.STEP
+            self.previous = {self.player: self.player.rect.topleft}
+            if not self.intro_step():
+                self.scene = PLAYING
+                self.accumulator = 0.0
+                break
+        self.profiler.mark(profiler.UPDATE)
+        self.draw_screen(self.accumulator / simulation.STEP)
+        
+    def skip_intro(self):
+        """Put the player in position and start playing at once."""
+        super().skip_intro()
+        self.scene = PLAYING
+        
+    def run_frame(self, frame_time=simulation.STEP):
+        """Run every fixed step due after frame_time seconds, then draw.
+        
+        Time left over carries to the next frame, and sprites are drawn
+        that fraction of a step on from their last positions, so motion is
+        smooth at any frame rate. By default exactly one step is run.
+        """
+        self.accumulator = min(self.accumulator + frame_time, MAX_FRAME_TIME)
         pressed_keys = pygame.key.get_pressed()
-        self.player.update(pressed_keys)
+        while self.accumulator >= simulation.STEP and self.alive:
+            if self.replay is not None:
+                self.replay.record(pressed_keys, self.actions)
+            self.step(pressed_keys, self.actions)
+            self.actions = 0
+            self.accumulator -= simulation.STEP
+            
+        # Save the replay once the losing step has scored everything
+        if not self.alive:
+            self.save_replay()
         
-        # Update positions of enemies, clouds
-        self.enemies.update()
-        self.back_clouds.update()
-        self.front_clouds.update()
-        self.balloons.update()       
+        # Update cooldown bars and text
+        self.hud.update(self.score, self.level)
+        self.draw_screen(self.accumulator / simulation.STEP)
         
-        # Update cooldown bars
-        self.flash_cooldown.update()
-        self.defend_cooldown.update()
+    def step(self, pressed_keys, actions=0):
+        """Step the simulation, keeping positions to draw from."""
+        self.previous = {sprite: sprite.rect.topleft for sprite in self.all_sprites}
+        self.previous[self.player] = self.player.rect.topleft
+        super().step(pressed_keys, actions)
 
     def player_loses(self, missile):
         """Player hit by missile."""
-        self.player.surf = pygame.image.load("resources/explosion.png").convert()
-        self.player.surf.set_colorkey((255, 255, 255), RLEACCEL)  
-        missile.kill()
-        self.pause = True
-        self.alive = False        
+        super().player_loses(missile)
+        self.scene = NAME_ENTRY
+        self.top_scores = disk.WORKER.submit(scores.STORE.top)
         
-    def draw_screen(self):
-        """Draw objects onto screen."""
+    def save_replay(self):
+        """Write the replay of this game in the background, once only."""
+        if self.replay is not None:
+            path = f"{self.options['record']}.{self.game}"
+            disk.WORKER.submit(self.replay.save, path, self.score)
+            self.replay = None
+        
+    def draw_screen(self, alpha=1.0):
+        """Draw objects onto screen, alpha of a step on from the last."""
         # Fill screen with sky blue
-        self.screen.fill((135, 200, 245))    
+        self.renderer.begin(self.previous, alpha)
+        position = self.renderer.position
         
         # Draw sprites, clouds last so they are on top
-        for cloud in self.back_clouds:
-            self.screen.blit(cloud.surf, cloud.rect)
-        #self.screen.blit(self.player.get_surf(), self.player.rect)
-        self.player.draw(self.screen)
-        for balloon in self.balloons:
-            self.screen.blit(balloon.surf, balloon.rect)
+        self.back_clouds.draw(self.renderer, alpha)
+        self.player.draw(self.renderer, position(self.player))
+        self.renderer.draw_group(self.balloons)
         for enemy in self.enemies:
-            enemy.draw()
-        for cloud in self.front_clouds:
-            self.screen.blit(cloud.surf, cloud.rect)
-            
-        self.screen.blit(self.flash_cooldown.surface, (10, 5))
-        self.screen.blit(self.defend_cooldown.surface, (10, 30))
-            
-        if self.level > 5:
-            color_filter = strobe_color()
-            self.screen.blit(color_filter, (0, 0))   
+            enemy.draw(self.renderer, position(enemy))
+        self.front_clouds.draw(self.renderer, alpha)
             
-        # Draw flash and defend on cool down bars
-        flash_surf = pygame.font.Font(None, 24).render("Flash", True, (0, 0, 0))
-        defend_surf = pygame.font.Font(None, 24).render("Defend", True, (0, 0, 0))
-        self.screen.blit(flash_surf, (12, 7))
-        self.screen.blit(defend_surf, (12, 32))
+        # Strobe changes every pixel so the whole screen is pushed
+        strobe = self.level > 5
+        if strobe:
+            now = self.clock.time() - (1 - alpha) * simulation.STEP
+            self.strobe.draw(self.renderer, now)
             
-        # Draw level and score
-        score_txt = f"Score: {self.score}"
-        level_txt = f"Level: {self.level}"
-        score_surf = pygame.font.Font(None, 38).render(score_txt, True, (0, 0, 0))
-        level_surf = pygame.font.Font(None, 38).render(level_txt, True, (0, 0, 0))
-        self.screen.blit(score_surf, (10, 55))
-        self.screen.blit(level_surf, (10, 80))
+        # Draw cooldown bars, level and score above the strobe
+        self.hud.draw(self.renderer)
+        self.profiler.draw(self.renderer)
+        self.profiler.mark(profiler.DRAW)
             
         # Update display
-        pygame.display.flip()        
+        self.renderer.finish(full=strobe)
+        self.profiler.mark(profiler.FLIP)
         
-    def end_screen(self):      
-        if not self.input_name():
-            return None
-        self.screen.fill((255, 200, 200))
-        hs_text = "High Scores"
-        height = 100
-        pos = (SCREEN_WIDTH/2, height)
-        score_font = pygame.font.Font(None, 60)
-        score_surf = score_font.render(hs_text, True, (0, 0, 0)) 
-        score_rect = score_surf.get_rect(center=(pos))
-        self.screen.blit(score_surf, score_rect)
+    def enter_name(self, event):
+        """Type the player's name, showing the high scores once entered."""
+        self.name_entry.key(event)
+        if not self.name_entry.done:
+            return
+        self.name = self.name_entry.name
+        if not self.name:
+            self.scene = GAME_OVER
+            return
+        self.post_score()
+        self.scene = HIGH_SCORES
+        self.table_shown = False
         
-        with open("resources/high_scores.pkl", 'rb') as file:
-            hs = pickle.load(file)
-        hs.append([self.name, self.score])
-        hs = sorted(hs, key=lambda x: x[1], reverse=True)[:5]
-        for score in hs:
-            height += 50
-            pos = (SCREEN_WIDTH/2, height)               
-            text = f"{score[0]}: {score[1]}"         
-            score_surf = score_font.render(text, True, (0, 0, 0))
-            score_rect = score_surf.get_rect(center=(pos))
-            self.screen.blit(score_surf, score_rect)
-            
-        with open("resources/high_scores.pkl", 'wb') as file:
-            pickle.dump(hs, file)
-    
-        pygame.display.flip()     
-        
-    def input_name(self):
-        # basic font for user typed
-        base_font = pygame.font.Font(None, 32)
-        user_text = ''
-        
-        # Input box 
-        input_rect = pygame.Rect(200, 200, 100, 40)
+    def post_score(self):
+        """Save the score in the background, never waiting on the disk."""
+        if self.top_scores is None:
+            self.top_scores = disk.WORKER.submit(scores.STORE.top)
+        disk.WORKER.submit(scores.STORE.add, self.name, self.score)
         
-        # Colors for change when user clicks box
-        color = (150, 150, 150)
-        active = False
-        continue_text_enter = True
-        
-        while continue_text_enter:
-            for event in pygame.event.get():
-                # if user types QUIT then the screen will close
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    self.quit = True
-            
-                if event.type == pygame.KEYDOWN:
-                    # End text enter on return
-                    if event.key == K_RETURN:
-                        continue_text_enter = False
-                    elif event.key == K_ESCAPE:
-                        continue_text_enter = False
-                        self.quit = False
-                    # Check for backspace
-                    elif event.key == pygame.K_BACKSPACE:
-                        # Set text as all but last element
-                        user_text = user_text[:-1]
-                    else:
-                        # Add the character to the string
-                        user_text += event.unicode  
-                        
-            self.name = user_text
-            
-            # Set background color of screen
-            back_surf = pygame.Surface((300, 300))
-            back_surf.set_alpha(10)
-            back_surf.fill((200, 200, 200))
-            back_rect = back_surf.get_rect()
-            back_rect.center = (50+SCREEN_WIDTH/2, SCREEN_HEIGHT/2)
-            self.screen.blit(back_surf, back_rect)
-                
-            # Draw a rectangle on the screen
-            input_rect.center = (SCREEN_WIDTH/2, 300)
-            pygame.draw.rect(self.screen, color, input_rect)
+    def rank_score(self):
+        """Rank the score among the best, once they have been fetched."""
+        ranked = self.top_scores.result() + [(self.name, self.score)]
+        ranked.sort(key=lambda entry: entry[1], reverse=True)
+        self.high_scores = ranked[:scores.TOP_N]
 
-            # Create the surface objects for the text by rendering fonts
-            score_surface = base_font.render(f"Score: {self.score}", True, (0, 0, 0))
-            instruct_surface = base_font.render("Type name below", True, (0, 0, 0))
-            text_surface = base_font.render(user_text, True, (255, 255, 255))
-        
-            # Blit the three surfaces containing text to the screen
-            self.screen.blit(score_surface, (input_rect.x, input_rect.y-100))
-            self.screen.blit(instruct_surface, (input_rect.x, input_rect.y-50))
-            self.screen.blit(text_surface, (input_rect.x+5, input_rect.y+5))
-        
-            # Set width of textfield so that text cannot get outside of user's text input
-            input_rect.w = max(100, text_surface.get_width()+10)
         
-            # Flip will update the portion of the screen that has changed
-            pygame.display.flip()
-        
-            # Ensure 30 fps
-            CLOCK.tick(30)   
-    
-        # False return means no name was inputed and the highscores are not shown
-        if user_text == "" or user_text is None or user_text == '\n':
-            return False    
-        else:
-            return True
-            
-    def starting_animation(self):
-        for i in range(30):
-            new_cloud = cloud.Cloud()
-            self.all_sprites.add(new_cloud)
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_WIDTH)
-            new_cloud.rect.topleft = (x, y)
-            if random.random() < 0.5:
-                new_cloud.speed = int(0.5*new_cloud.speed)
-                self.back_clouds.add(new_cloud)
-            else:   
-                new_cloud.surf.set_alpha(140)
-                self.front_clouds.add(new_cloud)        
-        while self.player.rect.left < 100:
-            self.player.rect.move_ip(PLAYER_SPEED/2, 0)
-            for back_cloud in self.back_clouds:
-                back_cloud.update()
-            for front_cloud in self.front_clouds:
-                front_cloud.update()
-            self.draw_screen()
-            CLOCK.tick(FPS)        
-
-        
-def reset_events():
-    """Setup custom events."""
-    # Set timers for regular occurance of events.
-    pygame.time.set_timer(ADD_CLOUD, int(CLOUD_PERIOD))
-    pygame.time.set_timer(ADD_BALLOON, int(BALLOON_PERIOD)) 
-    pygame.time.set_timer(INCR_DIFF, int(DIFFICULTY_PERIOD))  
-            
-            
-def strobe_color():
-    t = time.time() % (2*np.pi)
-    red = 125 * (np.sin(t) + 1)
-    blue = 125 * (np.sin(t + 2*np.pi/3) + 1)
-    green = 125 * (np.sin(t + 4*np.pi/3) + 1)
-    alpha = 60 * (np.sin(10 * t) + 1)
-    color_filter = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    color_filter.set_alpha(alpha)    
-    color_filter.fill((red, blue, green))
-    return color_filter
-
-
 def scale_rect(rect: pygame.Rect, factor):
     center = rect.center
     rect.w *= factor
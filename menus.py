@@ -0,0 +1,83 @@
+import pygame
+
+from pygame.locals import (
+    K_BACKSPACE,
+    K_ESCAPE,
+    K_RETURN,
+    )
+
+import hud
+
+
+# Name entry text and input box colours, and font size
+BOX_COLOR = (150, 150, 150)
+NAME_COLOR = (255, 255, 255)
+ENTRY_SIZE = 32
+
+# Grey backdrop faded in a little more each frame
+BACKDROP_SIZE = (300, 300)
+BACKDROP_COLOR = (200, 200, 200)
+BACKDROP_ALPHA = 10
+
+# High score table background, font size and line spacing
+TABLE_COLOR = (255, 200, 200)
+TABLE_SIZE = 60
+LINE_HEIGHT = 50
+
+
+class NameEntry():
+    def __init__(self, screen_size, text=None):
+        """Box for typing a name over the last game frame.
+
+        Fed key presses from the main loop, one frame at a time. The
+        backdrop is made once and text comes from the shared text cache,
+        so drawing a frame allocates nothing new unless the name changed.
+        """
+        self.text = text or hud.TEXT
+        width, height = screen_size
+        self.name = ""
+        self.done = False
+
+        self.backdrop = pygame.Surface(BACKDROP_SIZE)
+        self.backdrop.set_alpha(BACKDROP_ALPHA)
+        self.backdrop.fill(BACKDROP_COLOR)
+        self.backdrop_rect = self.backdrop.get_rect(center=(50 + width/2, height/2))
+        self.box = pygame.Rect(0, 0, 100, 40)
+        self.box.center = (width/2, 300)
+        self.instructions = self.text.render("Type name below", ENTRY_SIZE)
+
+    def key(self, event):
+        """Apply a key press, return once return or escape ends entry."""
+        if event.key == K_RETURN:
+            self.done = True
+        elif event.key == K_ESCAPE:
+            self.name = ""
+            self.done = True
+        elif event.key == K_BACKSPACE:
+            self.name = self.name[:-1]
+        else:
+            self.name += event.unicode
+
+    def draw(self, screen: pygame.Surface, score):
+        screen.blit(self.backdrop, self.backdrop_rect)
+        name_surf = self.text.render(self.name, ENTRY_SIZE, NAME_COLOR)
+
+        # Widen the box so the name never spills out of it
+        self.box.w = max(100, name_surf.get_width() + 10)
+        pygame.draw.rect(screen, BOX_COLOR, self.box)
+        score_surf = self.text.render(f"Score: {score}", ENTRY_SIZE)
+        screen.blit(score_surf, (self.box.x, self.box.y - 100))
+        screen.blit(self.instructions, (self.box.x, self.box.y - 50))
+        screen.blit(name_surf, (self.box.x + 5, self.box.y + 5))
+
+
+def draw_high_scores(screen: pygame.Surface, high_scores, text=None):
+    """Draw the best scores as (name, score) over a plain background."""
+    text = text or hud.TEXT
+    screen.fill(TABLE_COLOR)
+    x, y = screen.get_width() / 2, 100
+    lines = ["High Scores"] + [f"{name}: {score}" for name, score in high_scores]
+    for line in lines:
+        surf = text.render(line, TABLE_SIZE)
+        screen.blit(surf, surf.get_rect(center=(x, y)))
+        y += LINE_HEIGHT
@@ -0,0 +1,81 @@
+import heapq
+import pygame
+
+
+# Colour left transparent in a layer's strip
+CLEAR = (0, 0, 0)
+
+
+class ScrollingLayer():
+    def __init__(self, screen_size, speed, max_width, alpha=None):
+        """Background layer composited into one wide strip that scrolls.
+
+        Pictures are drawn into the strip once when added, at a position in
+        layer coordinates that grows by speed pixels every step. The strip
+        wraps around, so it is only as wide as the screen plus the widest
+        picture and a step of scrolling. Columns are cleared as they
+        scroll off the left, a step late so interpolated frames still show
+        them, ready for pictures added off the right. Drawing takes at
+        most two blits, the second covering the wrap, and tells the
+        renderer where the pictures are so dirty rendering only pushes
+        them rather than the whole strip.
+        """
+        self.width, self.height = screen_size
+        self.speed = speed
+        self.strip_width = self.width + max_width + speed
+        self.strip = pygame.Surface((self.strip_width, self.height)).convert()
+        self.strip.set_colorkey(CLEAR)
+        self.strip.fill(CLEAR)
+        if alpha is not None:
+            self.strip.set_alpha(alpha)
+
+        # Layer coordinate of the left of the screen
+        self.scroll = 0
+
+        # Right edge, left edge, top, width and height of pictures not yet
+        # scrolled off, in layer coordinates
+        self.pictures = []
+
+    def add(self, surf: pygame.Surface, x, y):
+        """Composite a picture with its top left at x, y on the screen."""
+        left = self.scroll + x
+        strip_x = left % self.strip_width
+        self.strip.blit(surf, (strip_x, y))
+        if strip_x + surf.get_width() > self.strip_width:
+            self.strip.blit(surf, (strip_x - self.strip_width, y))
+        width, height = surf.get_size()
+        heapq.heappush(self.pictures, (left + width, left, y, width, height))
+
+    def step(self):
+        """Scroll one step, clearing columns now a step past the left."""
+        self.clear(self.scroll - self.speed, self.speed)
+        self.scroll += self.speed
+        while self.pictures and self.pictures[0][0] <= self.scroll:
+            heapq.heappop(self.pictures)
+
+    def clear(self, left, width):
+        """Clear width columns of the strip from layer coordinate left."""
+        strip_x = left % self.strip_width
+        first = min(width, self.strip_width - strip_x)
+        self.strip.fill(CLEAR, (strip_x, 0, first, self.height))
+        if first < width:
+            self.strip.fill(CLEAR, (0, 0, width - first, self.height))
+
+    def __len__(self):
+        """Pictures at least partly on or right of the screen."""
+        return len(self.pictures)
+
+    def draw(self, renderer, alpha=1.0):
+        """Draw the visible part of the strip, alpha of a step on."""
+        scroll = self.scroll - round(self.speed * (1 - alpha))
+        strip_x = scroll % self.strip_width
+        first = min(self.width, self.strip_width - strip_x)
+        opaque = [pygame.Rect(left - scroll, y, width, height)
+                  for _, left, y, width, height in self.pictures]
+        renderer.blit(
+            self.strip, (0, 0), key=scroll, area=(strip_x, 0, first, self.height),
+            opaque=opaque)
+        if first < self.width:
+            renderer.blit(
+                self.strip, (first, 0), key=scroll,
+                area=(0, 0, self.width - first, self.height), opaque=opaque)
@@ -1,6 +1,8 @@
 import numpy as np
 import pygame
-import time
+
+import assets
+import cooldown
 
 from pygame import(
     K_UP,
@@ -17,12 +19,17 @@ PLAYER_SPEED = 10
 MAX_ROT = 15
 FRAME_ROT = 1
 
+# Steepest angle reached, as the last rotation step can overshoot MAX_ROT
+MAX_ANGLE = MAX_ROT + 3 * FRAME_ROT
+
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self):
+    def __init__(self, clock):
         super(Player, self).__init__()
-        self.surf = pygame.image.load("resources/plane.png").convert()
-        self.surf.set_colorkey((255, 255, 255), pygame.RLEACCEL)
+        # Game clock providing time() in seconds for cooldowns
+        self.clock = clock
+        self.surf = assets.get("plane")
+        self.rotations = assets.rotated("plane", MAX_ANGLE)
         
         
         self.screen_width, self.screen_height = pygame.display.get_surface().get_size()        
@@ -33,17 +40,20 @@ class Player(pygame.sprite.Sprite):
         # Current rotation
         self.angle = 0
         
-        self.flash_time = 0
-        self.defend_time = 0
         self.direction = [0, 0]
         
+        # Abilities, shown by the HUD's cooldown bars
+        self.flash_cooldown = cooldown.CoolDown(clock)
+        self.defend_cooldown = cooldown.CoolDown(clock)
+        
         # Defend counter
         self.is_defending = 0
-        self.defend_time = 0   
-        self.defend_cooldown = 5
         
-    def draw(self, screen):
-        screen.blit(self.get_surf(), self.rect)
+    def draw(self, screen, dest=None):
+        """Draw at dest, the current rect unless an interpolated position."""
+        if dest is None:
+            dest = self.rect
+        screen.blit(self.get_surf(), dest)
         if self.is_defending:
             surf = pygame.Surface((64, 64))
             surf.set_colorkey((0, 0, 0))
@@ -51,24 +61,17 @@ class Player(pygame.sprite.Sprite):
             rect = surf.get_rect()
             rect.center = self.rect.center
             pygame.draw.circle(surf, (255, 200, 100), (32, 30), 32)        
-            screen.blit(surf, self.rect)
+            screen.blit(surf, dest)
     
-    def defend(self, cool_down=5):
-        if self.defend_cooldown_remaining():
+    def defend(self):
+        if not self.defend_cooldown.trigger():
             return False
-        self.defend_time = time.time()
         self.is_defending = 5
+        return True
         
-    def defend_cooldown_remaining(self):
-        remaining = 5 + self.defend_time - time.time()
-        if remaining < 0:
-            remaining = 0
-        return remaining
-        
-    def flash(self, boost=20, cool_down=5):
-        if time.time() - self.flash_time < cool_down:
+    def flash(self, boost=20):
+        if not self.flash_cooldown.trigger():
             return False
-        self.flash_time = time.time()
         speed = PLAYER_SPEED        
         if self.direction == [0, 0]:
             self.direction = [1, 0]
@@ -85,8 +88,19 @@ class Player(pygame.sprite.Sprite):
         else:
             return self.surf
         
+    @property
+    def mask(self):
+        """Collision mask matching the surface drawn this frame."""
+        return self.rotations.mask(self.angle)
+
+    @property
+    def hit_rect(self):
+        """Rect covering the surface drawn this frame, which grows as the
+        plane banks."""
+        return pygame.Rect(self.rect.topleft, self.get_surf().get_size())
+        
     def rotate(self):
-        return pygame.transform.rotate(self.surf, self.angle)        
+        return self.rotations.get(self.angle)
     
     def update(self, pressed_keys):
         if self.is_defending:
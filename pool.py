@@ -0,0 +1,92 @@
+import pygame
+
+
+# Free sprites kept by a pool unless given another cap
+POOL_CAP = 64
+
+
+class SpritePool():
+    def __init__(self, sprite_class, cap=POOL_CAP):
+        """Recycles killed sprites of one class instead of allocating more.
+
+        Sprites come from acquire and return through release when killed.
+        A recycled sprite has its reset method called with the arguments
+        its constructor would have taken, so it must leave the sprite as a
+        new one would be and draw the same random numbers. At most cap free
+        sprites are kept, the rest are left to the garbage collector.
+        """
+        self.sprite_class = sprite_class
+        self.cap = cap
+        self.free = []
+
+        # Sprites handed out and recycled, and the most ever in use or free
+        self.acquired = 0
+        self.hits = 0
+        self.dropped = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.peak_free = 0
+
+    def acquire(self, *args):
+        """Return a reset free sprite, or a new one if none are free."""
+        self.acquired += 1
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            self.hits += 1
+        else:
+            sprite = self.sprite_class(*args)
+            sprite.pool = self
+        sprite.pooled = False
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        return sprite
+
+    def release(self, sprite: pygame.sprite.Sprite):
+        """Take back a killed sprite, ignoring any already released."""
+        if sprite.pooled:
+            return
+        sprite.pooled = True
+        self.in_use -= 1
+        if len(self.free) < self.cap:
+            self.free.append(sprite)
+            self.peak_free = max(self.peak_free, len(self.free))
+        else:
+            self.dropped += 1
+
+    def hit_rate(self):
+        return self.hits / self.acquired if self.acquired else 0.0
+
+    def stats(self):
+        return {
+            "acquired": self.acquired,
+            "hit_rate": self.hit_rate(),
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "peak_in_use": self.peak_in_use,
+            "peak_free": self.peak_free,
+            "dropped": self.dropped,
+            }
+
+
+class Pooled():
+    """Mixin for sprites handed out by a SpritePool.
+
+    Sprites built directly have no pool and are simply dropped when killed.
+    """
+    pool: SpritePool = None
+    pooled = False
+
+    def release(self):
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+def report(pools):
+    """Print stats for a dict of pools keyed on name."""
+    for name, sprite_pool in pools.items():
+        s = sprite_pool.stats()
+        print(f"{name:<14} {s['acquired']:>7} acquired, "
+              f"{100 * s['hit_rate']:5.1f}% recycled, "
+              f"peak {s['peak_in_use']} in use / {s['peak_free']} free, "
+              f"{s['dropped']} dropped")
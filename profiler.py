@@ -0,0 +1,150 @@
+import csv
+import json
+import numpy as np
+import pygame
+import sys
+import time
+
+
+# Phases of a frame, in the order they run
+PHASES = ("events", "update", "collide", "draw", "flip", "capture")
+EVENTS, UPDATE, COLLIDE, DRAW, FLIP, CAPTURE = range(len(PHASES))
+
+# Counts recorded alongside the timings each frame
+COUNTS = (
+    "enemies",
+    "balloons",
+    "back_clouds",
+    "front_clouds",
+    "all_sprites",
+    "narrow_phase_calls",
+    "narrow_phase_us",
+    "allocated_blocks",
+    )
+
+# Frames kept before the oldest are overwritten
+CAPACITY = 900
+
+# Overlay size, colours for each phase, and ms per pixel of bar height
+GRAPH_SIZE = (300, 100)
+PHASE_COLORS = (
+    (200, 200, 200),
+    (50, 150, 255),
+    (255, 150, 0),
+    (50, 200, 50),
+    (200, 50, 200),
+    (255, 255, 0),
+    )
+MS_PER_PIXEL = 0.5
+
+# Frame budget in ms at the simulation rate
+BUDGET = 1e3 / 30
+
+
+class Profiler():
+    def __init__(self, enabled=False, capacity=CAPACITY):
+        """Per-phase frame timings and counts kept in a ring buffer.
+
+        Call begin_frame, then mark at the end of each phase, then
+        end_frame. Every call returns at once while disabled.
+        """
+        self.enabled = enabled
+        self.show = False
+
+        # Set when shown mid-frame, to start recording with the next frame
+        self.enable_next = False
+        self.capacity = capacity
+        self.durations = np.zeros((capacity, len(PHASES)))
+        self.counts = np.zeros((capacity, len(COUNTS)), np.int64)
+        self.frames = 0
+        self.row = 0
+        self.mark_time = 0.0
+        self.blocks = 0
+
+        # Surface the graph is drawn on, created when first shown
+        self.graph: pygame.Surface = None
+
+    def toggle(self):
+        """Show or hide the overlay, recording from the frame after it is
+        first shown."""
+        self.show = not self.show
+        if self.show and not self.enabled:
+            self.enable_next = True
+
+    def begin_frame(self):
+        if self.enable_next:
+            self.enabled = True
+            self.enable_next = False
+        if not self.enabled:
+            return
+        self.row = self.frames % self.capacity
+        self.durations[self.row] = 0
+        self.blocks = sys.getallocatedblocks()
+        self.mark_time = time.perf_counter()
+
+    def mark(self, phase):
+        """Record the time since the last mark against phase."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.durations[self.row, phase] += now - self.mark_time
+        self.mark_time = now
+
+    def end_frame(self, counts):
+        """Record counts, ordered as COUNTS without allocated blocks."""
+        if not self.enabled:
+            return
+        self.counts[self.row, :-1] = counts
+        self.counts[self.row, -1] = sys.getallocatedblocks() - self.blocks
+        self.frames += 1
+
+    def recent(self):
+        """Durations in ms and counts for stored frames, oldest first."""
+        n = min(self.frames, self.capacity)
+        order = (np.arange(n) + self.frames - n) % self.capacity
+        return 1e3 * self.durations[order], self.counts[order]
+
+    def export(self, path):
+        """Write stored frames to path as JSON or, otherwise, CSV."""
+        durations, counts = self.recent()
+        first = self.frames - len(durations)
+        if path.endswith(".json"):
+            frames = [
+                {"frame": first + i,
+                 **{f"{p}_ms": d for p, d in zip(PHASES, row_d.tolist())},
+                 **dict(zip(COUNTS, row_c.tolist()))}
+                for i, (row_d, row_c) in enumerate(zip(durations, counts))]
+            with open(path, "w") as file:
+                json.dump(frames, file, indent=1)
+        else:
+            with open(path, "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["frame", *(f"{p}_ms" for p in PHASES), *COUNTS])
+                for i, (row_d, row_c) in enumerate(zip(durations, counts)):
+                    writer.writerow(
+                        [first + i, *np.round(row_d, 4).tolist(), *row_c.tolist()])
+
+    def draw(self, renderer):
+        """Draw recent frame times as stacked bars, one pixel per frame."""
+        if not self.show:
+            return
+        if self.graph is None:
+            self.graph = pygame.Surface(GRAPH_SIZE)
+            self.graph.set_alpha(200)
+        width, height = GRAPH_SIZE
+        self.graph.fill((0, 0, 0))
+        durations, _ = self.recent()
+        for x, row in enumerate(durations[-width:].tolist()):
+            bottom = height
+            for phase, ms in enumerate(row):
+                bar = int(ms / MS_PER_PIXEL)
+                if bar:
+                    rect = (x, bottom - bar, 1, bar)
+                    self.graph.fill(PHASE_COLORS[phase], rect)
+                    bottom -= bar
+
+        # Line marking a full frame at the simulation rate
+        budget = height - int(BUDGET / MS_PER_PIXEL)
+        pygame.draw.line(self.graph, (255, 0, 0), (0, budget), (width, budget))
+        screen_width = renderer.screen.get_width()
+        renderer.blit(self.graph, (screen_width - width - 10, 10), key=self.frames)
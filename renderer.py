@@ -0,0 +1,118 @@
+import numpy as np
+import pygame
+
+
+# Background colour behind every layer
+SKY = (135, 200, 245)
+
+# Side in pixels of the tiles changed areas are merged on in dirty mode
+TILE = 32
+
+
+class Renderer():
+    def __init__(self, screen: pygame.Surface, dirty=False):
+        """Draw layers onto the screen and push them to the display.
+
+        Layers are drawn in the order they are blitted each frame. In dirty
+        mode only the areas where something was added, moved or removed
+        since the last frame are pushed to the display, rather than flipping
+        the whole screen. Changed areas are merged on a grid of tiles, so
+        overlapping areas are only counted and pushed once.
+        """
+        self.screen = screen
+        self.dirty = dirty
+
+        # Tiles of the screen changed this frame
+        width, height = screen.get_size()
+        self.tiles = np.zeros((-(-height // TILE), -(-width // TILE)), bool)
+
+        # Blits made this frame and last frame as (surface, rect, key)
+        self.items = []
+        self.prev_items = None
+
+        # Positions before the last simulation step keyed on sprite, and
+        # the fraction of the way to the current positions to draw at
+        self.previous = None
+        self.alpha = 1.0
+
+        # Pixels sent to the display last frame and in total
+        self.pixels_pushed = 0
+        self.total_pixels_pushed = 0
+
+    def begin(self, previous=None, alpha=1.0):
+        """Clear the screen ready to draw a new frame.
+
+        previous maps sprites to their top left before the last step, to
+        draw them alpha of the way from there to their rects.
+        """
+        self.screen.fill(SKY)
+        self.items = []
+        self.previous = previous
+        self.alpha = alpha
+
+    def position(self, sprite: pygame.sprite.Sprite):
+        """Where to draw a sprite this frame."""
+        rect = sprite.rect
+        start = self.previous.get(sprite) if self.previous else None
+        if start is None or self.alpha >= 1:
+            return rect
+        x, y = start
+        return (round(x + (rect.x - x) * self.alpha),
+                round(y + (rect.y - y) * self.alpha))
+
+    def blit(self, surf: pygame.Surface, dest, key=None, area=None, special_flags=0,
+             opaque=None):
+        """Draw a surface, key marks a change to a surface drawn in place.
+
+        opaque lists the screen rects the surface actually draws on, when
+        the rest of it is transparent, so only they count as changed.
+        """
+        rect = self.screen.blit(surf, dest, area, special_flags)
+        if self.dirty and rect.w and rect.h:
+            for part in [rect] if opaque is None else opaque:
+                part = rect.clip(part)
+                if part.w and part.h:
+                    self.items.append((surf, tuple(part), key))
+        return rect
+
+    def draw_group(self, group: pygame.sprite.Group):
+        """Draw sprites that have a surf and rect but no draw method."""
+        for sprite in group:
+            self.blit(sprite.surf, self.position(sprite))
+
+    def finish(self, full=False):
+        """Push the frame to the display, in full if requested."""
+        items = set(self.items)
+        screen_pixels = self.screen.get_width() * self.screen.get_height()
+        if self.dirty and not full and self.prev_items is not None:
+            # Anything not drawn identically in both frames has changed
+            rects = self.merge(rect for _, rect, _ in items ^ self.prev_items)
+            pixels = sum(rect.w * rect.h for rect in rects)
+        else:
+            rects, pixels = None, screen_pixels
+            
+        # Flip when pushing the changed areas would cost more than the screen
+        if rects is None or pixels >= screen_pixels:
+            pygame.display.flip()
+            pixels = screen_pixels
+        elif rects:
+            pygame.display.update(rects)
+        self.pixels_pushed = pixels
+        self.total_pixels_pushed += self.pixels_pushed
+        self.prev_items = items if self.dirty else None
+
+    def merge(self, rects):
+        """Cover rects with runs of whole tiles along each row of tiles."""
+        tiles = self.tiles
+        tiles[:] = False
+        for left, top, width, height in rects:
+            tiles[top // TILE:(top + height - 1) // TILE + 1,
+                  left // TILE:(left + width - 1) // TILE + 1] = True
+        screen_rect = self.screen.get_rect()
+        merged = []
+        for row in np.flatnonzero(tiles.any(axis=1)).tolist():
+            edges = np.flatnonzero(np.diff(tiles[row], prepend=False, append=False))
+            for start, end in edges.reshape(-1, 2).tolist():
+                run = pygame.Rect(start * TILE, row * TILE, (end - start) * TILE, TILE)
+                merged.append(run.clip(screen_rect))
+        return merged
@@ -0,0 +1,106 @@
+import argparse
+import struct
+import time
+import zlib
+
+from pygame.locals import (
+    K_UP,
+    K_DOWN,
+    K_LEFT,
+    K_RIGHT,
+    )
+
+import simulation
+
+
+# File signature and format version
+MAGIC = b"MDRP"
+VERSION = 1
+
+# Magic, version, seed, final score and number of recorded steps
+HEADER = struct.Struct("<4sBQqI")
+
+# Bits of the byte recorded for each step, action flags sit above the keys
+KEY_BITS = (
+    (K_UP, 1),
+    (K_DOWN, 2),
+    (K_LEFT, 4),
+    (K_RIGHT, 8),
+    )
+ACTION_SHIFT = 4
+
+
+class Replay():
+    def __init__(self, seed, steps=None, score=None):
+        """Seed and per-step inputs of a game, one byte per step."""
+        self.seed = seed
+        self.steps = bytearray(steps or b"")
+        self.score = score
+
+    def record(self, pressed_keys, actions=0):
+        """Append the inputs given to one simulation step."""
+        self.steps.append(encode(pressed_keys, actions))
+
+    def save(self, path, score):
+        """Write the replay with the final score, compressing the inputs."""
+        self.score = score
+        header = HEADER.pack(MAGIC, VERSION, self.seed, score, len(self.steps))
+        with open(path, "wb") as file:
+            file.write(header + zlib.compress(bytes(self.steps), 9))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, version, seed, score, n_steps = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay")
+        steps = zlib.decompress(data[HEADER.size:])
+        if len(steps) != n_steps:
+            raise ValueError(f"{path} is truncated")
+        return cls(seed, steps, score)
+
+    def play(self, clouds=False):
+        """Replay the inputs in a headless simulation and return it."""
+        simulation.init_headless()
+        sim = simulation.Simulation(clouds, self.seed)
+        sim.skip_intro()
+        for byte in self.steps:
+            sim.step(*decode(byte))
+        return sim
+
+
+def encode(pressed_keys, actions=0):
+    """Pack held arrow keys and action flags into one byte."""
+    byte = actions << ACTION_SHIFT
+    for key, bit in KEY_BITS:
+        if pressed_keys[key]:
+            byte |= bit
+    return byte
+
+
+def decode(byte):
+    """Unpack a recorded byte into held keys and action flags."""
+    pressed = [key for key, bit in KEY_BITS if byte & bit]
+    return simulation.KeyState(pressed), byte >> ACTION_SHIFT
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play back a replay headlessly.")
+    parser.add_argument("path")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+    start = time.perf_counter()
+    sim = replay.play()
+    seconds = time.perf_counter() - start
+    n_steps = len(replay.steps)
+    print(f"{n_steps} steps in {seconds:.2f} s "
+          f"({n_steps * simulation.STEP / seconds:.0f}x real time)")
+    print(f"score {sim.score}, recorded score {replay.score}")
+    if sim.score != replay.score:
+        raise SystemExit("replayed score does not match the recording")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import pygame
+
+
+# Default angle between pre-rendered rotations in degrees
+ROTATION_STEP = 1
+
+
+class RotationCache():
+    def __init__(self, surf: pygame.Surface, max_angle, step=ROTATION_STEP):
+        """Pre-render a surface at every angle step within +/- max_angle."""
+        self.max_angle = max_angle
+        self.step = step
+        n_steps = int(round(2 * max_angle / step)) + 1
+        self.surfaces = [
+            pygame.transform.rotate(surf, -max_angle + i*step)
+            for i in range(n_steps)]
+        
+        # Collision masks for each rotation
+        self.masks = [pygame.mask.from_surface(s) for s in self.surfaces]
+
+        # Width and height covering every rotation drawn from one corner
+        self.size = (max(s.get_width() for s in self.surfaces),
+                     max(s.get_height() for s in self.surfaces))
+
+    def index(self, angle):
+        """Index of the pre-rendered surface closest to angle."""
+        # Offset is positive within range so int() rounds down
+        i = int((float(angle) + self.max_angle) / self.step + 0.5)
+        return min(max(i, 0), len(self.surfaces) - 1)
+
+    def get(self, angle):
+        """Return the surface rotated by the nearest cached angle."""
+        return self.surfaces[self.index(angle)]
+
+    def mask(self, angle):
+        """Return the collision mask for the nearest cached angle."""
+        return self.masks[self.index(angle)]
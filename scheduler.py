@@ -0,0 +1,145 @@
+import heapq
+
+
+# Most calls one event gets from one run_due, further calls it has fallen
+# behind by are skipped
+MAX_CATCH_UP = 16
+
+
+class Event():
+    def __init__(self, callback, period, count, order):
+        """A callback scheduled once, a number of times or forever.
+
+        period is the seconds between calls, count the calls left or None
+        for no limit, and order breaks ties with events due at the same
+        time, lowest first.
+        """
+        self.callback = callback
+        self.period = period
+        self.count = count
+        self.order = order
+
+        # Bumped whenever the event moves, so stale heap entries are skipped
+        self.generation = 0
+        self.cancelled = False
+
+        # Calls in a row made while already due again
+        self.behind = 0
+
+    def cancel(self):
+        """Stop calling back, for good."""
+        self.cancelled = True
+        self.generation += 1
+
+
+def check_period(period, count=1):
+    """Raise ValueError for a period that is not positive, or for repeats
+    without a period."""
+    if period is None:
+        if count != 1:
+            raise ValueError(f"{count} calls need a period")
+    elif period <= 0:
+        raise ValueError(f"period must be positive, not {period}")
+
+
+class Scheduler():
+    def __init__(self, clock):
+        """Callbacks due at times on a game clock, kept in one heap.
+
+        clock provides time() in seconds, usually the simulation clock, so
+        nothing fires while the game is paused and runs replay exactly.
+        Times and periods are given in ms like the spawn periods. run_due
+        calls everything due in time order, ties in the order the events
+        were created, and a repeating event is pushed back after each
+        call, so one many periods behind catches up in order with the rest,
+        up to MAX_CATCH_UP calls. Calls past that are skipped, counting
+        against a counted event, and the event resumes on its period.
+        """
+        self.clock = clock
+        self.heap = []
+        self.created = 0
+
+        # Callbacks made so far
+        self.calls = 0
+
+    def at(self, time, callback, period=None, count=1):
+        """Call back at time ms on the clock, then every period ms count times."""
+        return self.schedule(time / 1e3, callback, period, count)
+
+    def after(self, delay, callback, period=None, count=1):
+        """Call back delay ms from now, then every period ms count times."""
+        return self.schedule(
+            self.clock.time() + delay / 1e3, callback, period, count)
+
+    def every(self, period, callback, count=None):
+        """Call back every period ms from now, forever unless counted."""
+        return self.after(period, callback, period, count)
+
+    def burst(self, count, interval, callback, delay=0):
+        """Call back count times interval ms apart, starting after delay ms."""
+        return self.after(delay, callback, interval, count)
+
+    def wave(self, pattern, callback, delay=0):
+        """Schedule bursts given as (ms after the wave starts, count, ms
+        between calls), the wave starting after delay ms."""
+        return [self.burst(count, interval, callback, delay + start)
+                for start, count, interval in pattern]
+
+    def set_period(self, event: Event, period):
+        """Change a repeating event's period and restart its countdown,
+        unless it was cancelled."""
+        check_period(period)
+        event.period = period / 1e3
+        if event.cancelled:
+            return
+        event.generation += 1
+        self.push(event, self.clock.time() + event.period)
+
+    def schedule(self, seconds, callback, period, count):
+        """Create an event first due at seconds on the clock."""
+        check_period(period, count)
+        event = Event(callback, None if period is None else period / 1e3,
+                      count, self.created)
+        self.created += 1
+        self.push(event, seconds)
+        return event
+
+    def push(self, event: Event, time):
+        heapq.heappush(self.heap, (time, event.order, event.generation, event))
+
+    def run_due(self):
+        """Call back every event due by now."""
+        now = self.clock.time()
+        heap = self.heap
+        while heap and heap[0][0] <= now:
+            time, _, generation, event = heapq.heappop(heap)
+            if generation != event.generation or event.cancelled:
+                continue
+            if event.count is not None:
+                event.count -= 1
+            if event.count is None or event.count > 0:
+                time += event.period
+                if time > now:
+                    event.behind = 0
+                elif event.behind < MAX_CATCH_UP - 1:
+                    event.behind += 1
+                else:
+                    # Skip the calls still due, resuming after now
+                    skipped = int((now - time) // event.period) + 1
+                    time += skipped * event.period
+                    while time <= now:
+                        # Rounding can leave the next call due
+                        skipped += 1
+                        time += event.period
+                    event.behind = 0
+                    if event.count is not None:
+                        event.count -= skipped
+                if event.count is None or event.count > 0:
+                    self.push(event, time)
+            self.calls += 1
+            event.callback()
+
+    def __len__(self):
+        """Events still to be called."""
+        return sum(1 for _, _, generation, event in self.heap
+                   if generation == event.generation and not event.cancelled)
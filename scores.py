@@ -0,0 +1,115 @@
+import argparse
+import os
+import pickle
+import sqlite3
+import time
+
+
+# Database of every score, and the pickled top five it replaces
+SCORES_PATH = os.path.join("resources", "high_scores.db")
+LEGACY_PATH = os.path.join("resources", "high_scores.pkl")
+
+# Scores shown on the end screen
+TOP_N = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id);
+CREATE INDEX IF NOT EXISTS scores_by_name ON scores (name, score DESC);
+"""
+
+
+class ScoreStore():
+    def __init__(self, path=SCORES_PATH, legacy_path=LEGACY_PATH):
+        """Every score ever posted, kept in SQLite.
+
+        Each score is one inserted row committed in its own transaction, so
+        a crash never leaves a half written table and nothing is rewritten.
+        Top scores and a player's history are read through indexes. The
+        database is opened on first use, importing the old pickled high
+        scores if it is new. The connection may move between threads but
+        must only be used by one at a time, as with disk.WORKER.
+        """
+        self.path = path
+        self.legacy_path = legacy_path
+        self.connection: sqlite3.Connection = None
+
+    def connect(self):
+        if self.connection is not None:
+            return self.connection
+        new = not os.path.exists(self.path)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+        if new:
+            self.import_legacy()
+        return self.connection
+
+    def import_legacy(self):
+        """Copy scores from the pickled list, if there is a readable one."""
+        try:
+            with open(self.legacy_path, "rb") as file:
+                legacy = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO scores (name, score, time) VALUES (?, ?, 0)",
+                [(str(name), int(score)) for name, score in legacy])
+
+    def add(self, name, score):
+        """Record a score atomically."""
+        connection = self.connect()
+        with connection:
+            connection.execute(
+                "INSERT INTO scores (name, score, time) VALUES (?, ?, ?)",
+                (name, score, time.time()))
+
+    def top(self, n=TOP_N):
+        """Best n scores as (name, score), earliest first among ties."""
+        return self.connect().execute(
+            "SELECT name, score FROM scores ORDER BY score DESC, id LIMIT ?",
+            (n,)).fetchall()
+
+    def history(self, name, n=None):
+        """A player's scores as (score, time), best first."""
+        return self.connect().execute(
+            "SELECT score, time FROM scores WHERE name = ? "
+            "ORDER BY score DESC LIMIT ?", (name, -1 if n is None else n)).fetchall()
+
+    def count(self):
+        return self.connect().execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show high scores.")
+    parser.add_argument("--top", type=int, default=TOP_N)
+    parser.add_argument("--player", help="show every score by this player")
+    args = parser.parse_args()
+
+    if args.player:
+        for score, posted in STORE.history(args.player):
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(posted)) if posted else "-"
+            print(f"{score:>8}  {when}")
+    else:
+        for name, score in STORE.top(args.top):
+            print(f"{score:>8}  {name}")
+    print(f"{STORE.count()} scores stored")
+
+
+# Store shared by the whole game
+STORE = ScoreStore()
+
+
+if __name__ == "__main__":
+    main()
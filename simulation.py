@@ -0,0 +1,362 @@
+import argparse
+import os
+import pygame
+import random
+import time
+
+import assets
+import balloon
+import cloud
+import collision
+import enemy
+import lifecycle
+import parallax
+import player
+import pool
+import profiler
+import scheduler
+
+
+# Screen dimensions
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+
+# Simulation steps per second, and seconds per step
+FPS = 30
+STEP = 1 / FPS
+
+# Speeds in pixels per step
+PLAYER_SPEED = 10
+
+# Time between spawns in ms
+BALLOON_PERIOD = 4e3
+CLOUD_PERIOD = 3e2
+MISSILE_PERIOD = 1e3
+DIFFICULTY_PERIOD = 1e4
+
+# Factor applied to the missile period at each new level
+DIFFICULTY_DECAY = 0.8
+
+# Missile waves as bursts of (ms after the wave starts, missiles, ms
+# between them)
+WAVE = ((0, 5, 120), (1500, 8, 80), (3000, 12, 50))
+
+# Longest a missile stays in bounds in seconds, crossing the screen and
+# its own 20 pixel length at the slowest speed of 10 pixels a step, plus
+# a step for the one it spawns on
+MISSILE_LIFETIME = ((SCREEN_WIDTH + 20) / 10 + 1) * STEP
+
+# Player flies in from the left until reaching this position
+START_LEFT = 100
+
+# Actions triggered by a key press rather than held keys
+FLASH = 1
+DEFEND = 2
+
+# Subsystems drawing from their own random generator
+RNG_SUBSYSTEMS = ("enemies", "balloons", "clouds")
+
+
+class SimClock():
+    def __init__(self, start=0.0):
+        """Clock advanced by the simulation rather than following wall time."""
+        self.now = start
+
+    def time(self):
+        """Seconds of game time, standing in for time.time()."""
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class KeyState():
+    def __init__(self, pressed=()):
+        """Keys held down, indexed like pygame.key.get_pressed()."""
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class Simulation():
+    def __init__(self, clouds=True, seed=None, profile=None, check_leaks=False):
+        """Game state and rules, stepped at a fixed rate on a SimClock.
+
+        Needs a display mode to be set, which may use the dummy video driver.
+        Clouds only affect drawing so can be left out when running headless.
+        Games with the same seed and inputs play out identically, as each
+        spawner draws from its own generator seeded from the game seed.
+        profile is a Profiler to time each step with, kept across games.
+        check_leaks raises lifecycle.LeakError as soon as a sprite escapes
+        culling, for long soak runs.
+        """
+        self.screen = pygame.display.get_surface()
+        self.clock = SimClock()
+        self.clouds = clouds
+        self.profiler = profile or profiler.Profiler()
+        
+        # Random generators for each subsystem
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rngs = {
+            name: random.Random(f"{seed}:{name}") for name in RNG_SUBSYSTEMS}
+
+        # Convert all images once the display exists
+        assets.load_all()
+        assets.rotated("plane", player.MAX_ANGLE)
+        assets.rotated("explosion", player.MAX_ANGLE)
+        assets.rotated("missile", enemy.SINE_MAX_ANGLE)
+
+        # Generate cloud textures in the background
+        if clouds:
+            cloud.POOL.start(threaded=True)
+
+        # Create player
+        self.player = player.Player(self.clock)
+        self.alive = True
+
+        # Spawned sprites, killed once they leave the shared bounds
+        self.lifecycle = lifecycle.Lifecycle(self.screen.get_rect(), check=check_leaks)
+        self.all_sprites = self.lifecycle.all_sprites
+        self.balloons = self.lifecycle.add_group("balloons")
+        self.enemies = self.lifecycle.add_group(
+            "enemies", cull=False, lifetime=MISSILE_LIFETIME)
+
+        # Cloud layers, composited into scrolling strips
+        self.back_clouds = self.front_clouds = None
+        if clouds:
+            size = self.screen.get_size()
+            self.back_clouds = parallax.ScrollingLayer(
+                size, cloud.BACK_SPEED, cloud.MAX_WIDTH)
+            self.front_clouds = parallax.ScrollingLayer(
+                size, cloud.CLOUD_SPEED, cloud.MAX_WIDTH, cloud.FRONT_ALPHA)
+
+        # Moves and culls all missiles together
+        self.missiles = enemy.MissileEngine(self.screen.get_rect(), self.lifecycle.bounds)
+
+        # Pixel checks for sprites whose rects touch the player
+        self.narrow_phase = collision.NarrowPhase()
+
+        # Player score
+        self.score = 0
+
+        # Set difficulty level & time between missiles in ms
+        self.level = 1
+        self.missile_period = MISSILE_PERIOD
+        self.lifecycle.set_spawn_period("enemies", self.missile_period / 1e3)
+
+        # Spawns and difficulty run on simulation time
+        self.scheduler = scheduler.Scheduler(self.clock)
+        self.enemy_spawns = self.scheduler.every(self.missile_period, self.add_enemy)
+        self.scheduler.every(BALLOON_PERIOD, self.add_balloon)
+        self.scheduler.every(DIFFICULTY_PERIOD, self.increase_difficulty)
+        if clouds:
+            self.scheduler.every(CLOUD_PERIOD, self.add_cloud)
+
+    def step(self, pressed_keys, actions=0):
+        """Advance the game by one fixed step.
+        
+        actions are FLASH and DEFEND flags for keys pressed since the last
+        step, applied before moving.
+        """
+        self.act(actions)
+        self.clock.advance(STEP)
+        self.scheduler.run_due()
+        self.update_sprites(pressed_keys)
+        self.profiler.mark(profiler.UPDATE)
+        self.check_collisions()
+        self.profiler.mark(profiler.COLLIDE)
+
+    def profile_counts(self):
+        """Sprite counts, narrow phase calls and microseconds spent in
+        them, ordered as profiler.COUNTS."""
+        return (
+            len(self.enemies),
+            len(self.balloons),
+            len(self.back_clouds or ()),
+            len(self.front_clouds or ()),
+            len(self.all_sprites),
+            self.narrow_phase.calls,
+            round(1e6 * self.narrow_phase.time))
+
+    def act(self, actions):
+        """Apply action flags, returning flags for those off cooldown."""
+        done = 0
+        if actions & FLASH and self.flash():
+            done |= FLASH
+        if actions & DEFEND and self.defend():
+            done |= DEFEND
+        return done
+
+    def flash(self):
+        """Flash the player forward, True if it was off cooldown."""
+        return self.player.flash()
+
+    def defend(self):
+        """Raise the player's shield, True if it was off cooldown."""
+        return self.player.defend()
+
+    def add_enemy(self):
+        new_enemy = enemy.add_enemy(self.level, self.screen, self.rngs["enemies"])
+        self.missiles.add(new_enemy)
+        self.lifecycle.spawn(new_enemy, "enemies")
+
+    def launch_wave(self, pattern=WAVE, delay=0):
+        """Send missiles in bursts on top of the steady spawns."""
+        return self.scheduler.wave(pattern, self.add_enemy, delay)
+
+    def add_balloon(self):
+        new_balloon = balloon.POOL.acquire(self.rngs["balloons"])
+        self.lifecycle.spawn(new_balloon, "balloons")
+
+    def add_cloud(self, x=SCREEN_WIDTH, y=None):
+        """Add a cloud of random size to either the back or front layer.
+
+        Clouds come in just off the right at a random height unless placed.
+        """
+        rng = self.rngs["clouds"]
+        front = rng.random() >= 0.5
+        surf = cloud.POOL.get(rng.choice(cloud.SCALES), rng)
+        if y is None:
+            y = rng.randint(0, SCREEN_HEIGHT)
+        layer = self.front_clouds if front else self.back_clouds
+        layer.add(surf, x, y)
+
+    def scatter_clouds(self, n_clouds=30):
+        """Fill the sky with clouds at random positions."""
+        rng = self.rngs["clouds"]
+        for i in range(n_clouds):
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(0, SCREEN_WIDTH)
+            self.add_cloud(x, y)
+
+    def move_clouds(self):
+        if self.clouds:
+            self.back_clouds.step()
+            self.front_clouds.step()
+
+    def increase_difficulty(self):
+        """Increase difficulty by decreasing missile period."""
+        self.missile_period *= DIFFICULTY_DECAY
+        self.scheduler.set_period(self.enemy_spawns, self.missile_period)
+        self.lifecycle.set_spawn_period("enemies", self.missile_period / 1e3)
+        self.level += 1
+
+    def intro_step(self):
+        """Fly the player in from the left, False once in position."""
+        if self.player.rect.left >= START_LEFT:
+            return False
+        self.player.rect.move_ip(PLAYER_SPEED/2, 0)
+        self.move_clouds()
+        return True
+
+    def skip_intro(self):
+        while self.intro_step():
+            pass
+
+    def check_collisions(self):
+        """Check for collions with player."""
+        # Check if any enemies have collided with player, broad phase
+        # included, against the plane as drawn
+        hit_rect = self.player.hit_rect
+        for missile in self.missiles.colliding(hit_rect):
+            if not self.narrow_phase.overlap(self.player, missile):
+                continue
+            if self.player.is_defending:
+                missile.kill()
+                self.score += 5
+            else:
+                self.player_loses(missile)
+                break
+
+        # Check if any balloons have collided with player
+        balloons = self.balloons.sprites()
+        for i in hit_rect.collidelistall(balloons):
+            hit_balloon = balloons[i]
+            if not self.narrow_phase.overlap(self.player, hit_balloon):
+                continue
+            self.score += 10 + (self.level-1) * 2
+            hit_balloon.kill()
+
+    def update_sprites(self, pressed_keys):
+        """Update all sprites."""
+        self.player.update(pressed_keys)
+
+        # Update positions of enemies, clouds
+        self.missiles.step(self.clock.time())
+        self.move_clouds()
+        self.balloons.update()
+        self.lifecycle.cull()
+
+    def player_loses(self, missile):
+        """Player hit by missile."""
+        self.player.surf = assets.get("explosion")
+        self.player.rotations = assets.rotated("explosion", player.MAX_ANGLE)
+        missile.kill()
+        self.alive = False
+
+    def release_sprites(self):
+        """Kill every sprite, returning them to their pools, when the game
+        is thrown away."""
+        self.missiles.clear()
+        for sprite in self.all_sprites.sprites():
+            sprite.kill()
+
+
+def sprite_pools():
+    """Every sprite pool keyed on a name for reports."""
+    return {
+        **{cls.__name__: p for cls, p in enemy.POOLS.items()},
+        "Balloon": balloon.POOL,
+        }
+
+
+def init_headless():
+    """Set a display mode on the dummy video driver, so no window opens."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def run(n_steps, policy=None, clouds=False, seed=None, soak=False):
+    """Run a headless game until the player dies or n_steps have passed.
+
+    policy is called with the simulation before each step and returns the
+    keys held down and action flags; without one the player does nothing.
+    A soak run checks for leaked sprites and carries on after the player
+    dies, so always runs n_steps.
+    """
+    init_headless()
+    sim = Simulation(clouds, seed, check_leaks=soak)
+    sim.skip_intro()
+    idle = (KeyState(), 0)
+    for _ in range(n_steps):
+        if not sim.alive and not soak:
+            break
+        sim.step(*(policy(sim) if policy else idle))
+    return sim
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a headless game.")
+    parser.add_argument("--steps", type=int, default=10000)
+    parser.add_argument("--clouds", action="store_true")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--soak", action="store_true",
+                        help="check for leaked sprites and play on after dying")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    sim = run(args.steps, clouds=args.clouds, seed=args.seed, soak=args.soak)
+    seconds = time.perf_counter() - start
+    steps = round(sim.clock.time() / STEP)
+    print(f"{steps} steps in {seconds:.2f} s ({steps / seconds:.0f} steps/s)")
+    print(f"score {sim.score}, level {sim.level}, alive {sim.alive}, seed {sim.seed}")
+    print("peak live sprites", sim.lifecycle.peaks)
+    pool.report(sprite_pools())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import numpy as np
+import pygame
+
+from pygame.locals import (
+    BLEND_RGB_ADD,
+    BLEND_RGB_MULT,
+    )
+
+
+# Steps of the palette over one colour cycle of 2 pi seconds
+PALETTE_SIZE = 720
+
+# Brightest colour channel and most opaque alpha of the tint
+MAX_CHANNEL = 250
+MAX_ALPHA = 120
+
+
+def palette(size=PALETTE_SIZE):
+    """Tint colours and alphas for each step of the cycle."""
+    t = np.arange(size) * 2*np.pi / size
+    half = MAX_CHANNEL / 2
+    red = half * (np.sin(t) + 1)
+    blue = half * (np.sin(t + 2*np.pi/3) + 1)
+    green = half * (np.sin(t + 4*np.pi/3) + 1)
+    alpha = MAX_ALPHA / 2 * (np.sin(10 * t) + 1)
+
+    # Channels were always filled in this order, giving the familiar colours
+    colors = np.stack([red, blue, green], axis=1)
+    return colors.astype(int), alpha.astype(int)
+
+
+class Strobe():
+    def __init__(self, size, blend=False, palette_size=PALETTE_SIZE):
+        """Colour tint over the screen, cycling through a palette table.
+
+        Persistent overlays are refilled only when the palette step
+        changes. By default one overlay is alpha blitted. With blend the
+        screen is instead scaled by the inverse alpha then has the weighted
+        colour added, blitting two overlays with BLEND_RGB_MULT and
+        BLEND_RGB_ADD, which skips per-pixel alpha. Blits are used rather
+        than fills with the same flags, which pygame does not accelerate.
+        """
+        self.blend = blend
+        self.size = palette_size
+        colors, alphas = palette(palette_size)
+        self.colors = [tuple(color) for color in colors.tolist()]
+        self.alphas = alphas.tolist()
+
+        # Fill colours for the blended tint, matching an alpha blit
+        inverse = 255 - alphas
+        self.multiply = [(a, a, a) for a in inverse.tolist()]
+        weighted = colors * alphas[:, None] // 255
+        self.add = [tuple(color) for color in weighted.tolist()]
+
+        # Overlays and the palette step they were last filled with
+        self.overlay = pygame.Surface(size).convert()
+        self.add_overlay: pygame.Surface = None
+        if blend:
+            self.add_overlay = pygame.Surface(size).convert()
+        self.index = None
+
+    def phase(self, now):
+        """Palette step at time now in seconds."""
+        return int(now % (2*np.pi) / (2*np.pi) * self.size) % self.size
+
+    def draw(self, renderer, now):
+        i = self.phase(now)
+        if i != self.index:
+            self.fill(i)
+        if self.blend:
+            renderer.blit(self.overlay, (0, 0), key=i, special_flags=BLEND_RGB_MULT)
+            renderer.blit(self.add_overlay, (0, 0), key=i, special_flags=BLEND_RGB_ADD)
+        else:
+            renderer.blit(self.overlay, (0, 0), key=i)
+
+    def fill(self, i):
+        """Refill the overlays in place for palette step i."""
+        if self.blend:
+            self.overlay.fill(self.multiply[i])
+            self.add_overlay.fill(self.add[i])
+        else:
+            self.overlay.fill(self.colors[i])
+            self.overlay.set_alpha(self.alphas[i])
+        self.index = i
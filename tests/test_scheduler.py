@@ -0,0 +1,131 @@
+"""Behaviour of the spawn scheduler on a clock stepped by hand.
+
+Run from the repository root: python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import scheduler
+
+
+class Clock():
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def schedule(clock):
+    return scheduler.Scheduler(clock)
+
+
+def run(clock, schedule, seconds):
+    clock.advance(seconds)
+    schedule.run_due()
+
+
+def test_ties_run_in_creation_order(clock, schedule):
+    calls = []
+    schedule.burst(3, 100, lambda: calls.append("a"))
+    schedule.burst(3, 100, lambda: calls.append("b"))
+    for _ in range(4):
+        run(clock, schedule, 0.1)
+    assert calls == ["a", "b"] * 3
+    assert len(schedule) == 0
+
+
+def test_at_takes_ms(clock, schedule):
+    calls = []
+    schedule.at(500, lambda: calls.append(clock.time()))
+    run(clock, schedule, 0.25)
+    assert calls == []
+    run(clock, schedule, 0.25)
+    assert calls == [0.5]
+
+
+def test_wave_offsets_bursts(clock, schedule):
+    calls = []
+    schedule.wave(((0, 2, 250), (1000, 1, 250)), lambda: calls.append(clock.time()))
+    for _ in range(8):
+        run(clock, schedule, 0.25)
+    assert calls == [0.25, 0.25, 1.0]
+
+
+def test_cancelled_event_is_skipped(clock, schedule):
+    calls = []
+    event = schedule.every(100, lambda: calls.append("c"))
+    event.cancel()
+    run(clock, schedule, 1)
+    assert calls == []
+    assert len(schedule) == 0
+
+
+def test_set_period_does_not_revive_cancelled(clock, schedule):
+    calls = []
+    event = schedule.every(100, lambda: calls.append("c"))
+    event.cancel()
+    schedule.set_period(event, 50)
+    run(clock, schedule, 1)
+    assert calls == []
+    assert len(schedule) == 0
+
+
+def test_set_period_restarts_countdown(clock, schedule):
+    calls = []
+    event = schedule.every(100, lambda: calls.append(clock.time()))
+    run(clock, schedule, 0.05)
+    schedule.set_period(event, 200)
+    run(clock, schedule, 0.1)
+    assert calls == []
+    run(clock, schedule, 0.15)
+    assert calls == [pytest.approx(0.3)]
+
+
+def test_catch_up_is_capped(clock, schedule):
+    calls = []
+    schedule.every(10, lambda: calls.append("d"))
+    run(clock, schedule, 1)
+    assert len(calls) == scheduler.MAX_CATCH_UP
+
+    # Skipped calls are dropped and the event resumes on its period
+    run(clock, schedule, 0.01)
+    assert len(calls) == scheduler.MAX_CATCH_UP + 1
+
+
+def test_skipped_calls_count_against_burst(clock, schedule):
+    calls = []
+    schedule.burst(100, 1, lambda: calls.append("e"))
+    run(clock, schedule, 1)
+    assert len(calls) == scheduler.MAX_CATCH_UP
+    assert len(schedule) == 0
+
+
+@pytest.mark.parametrize("period", [0, -1])
+def test_rejects_period_not_positive(schedule, period):
+    with pytest.raises(ValueError):
+        schedule.every(period, lambda: None)
+    event = schedule.every(100, lambda: None)
+    with pytest.raises(ValueError):
+        schedule.set_period(event, period)
+
+
+def test_rejects_repeats_without_period(schedule):
+    with pytest.raises(ValueError):
+        schedule.at(0, lambda: None, count=3)
+    with pytest.raises(ValueError):
+        schedule.after(0, lambda: None, count=None)
+    assert len(schedule) == 0